@@ -4,12 +4,19 @@ Módulo de API.
 """
 
 from api.endpoints import Endpoints, VehicleType
+from api.cache import ResponseCache, MemoryCache, DiskCache, get_default_cache
 from api.fipe_client import FipeClient, FipeClientError, FipeRateLimitError, FipeRequestError
+from api.async_fipe_client import AsyncFipeClient
 
 __all__ = [
     "Endpoints",
     "VehicleType",
+    "ResponseCache",
+    "MemoryCache",
+    "DiskCache",
+    "get_default_cache",
     "FipeClient",
+    "AsyncFipeClient",
     "FipeClientError",
     "FipeRateLimitError",
     "FipeRequestError"
@@ -0,0 +1,709 @@
+# -*- coding: utf-8 -*-
+"""
+Cliente HTTP assíncrono para comunicação com a API FIPE.
+Usa aiohttp.ClientSession para permitir centenas de requisições em voo,
+sobrepondo a espera de rede com asyncio.gather.
+"""
+
+import asyncio
+import random
+import ssl
+from collections import deque
+from typing import Any, Deque, Dict, Mapping, Optional, Tuple
+
+import aiohttp
+import orjson
+
+try:
+    # Transporte preferencial: HTTP/2 multiplexa várias requisições em uma
+    # única sessão TLS, eliminando o limite de concorrência por conexão.
+    import httpx
+except ImportError:
+    httpx = None
+
+from utils.config import Config
+from utils.logger import setup_logger
+from api.endpoints import (
+    Endpoints,
+    FIPE_VALUE_PAYLOAD_KEYS,
+    YEAR_MODELS_PAYLOAD_KEYS
+)
+from api.cache import (
+    ENDPOINT_TTL,
+    ResponseCache,
+    get_default_cache,
+    make_cache_key
+)
+from api.fipe_client import (
+    FipeRateLimitError,
+    FipeRequestError
+)
+
+
+logger = setup_logger("async_fipe_client")
+
+
+# Janela de coalescência e tamanho máximo de cada lote de requisições
+BATCH_WINDOW = 0.02  # segundos
+BATCH_SIZE = 32
+
+
+# Exceções transitórias que disparam retry, por transporte disponível
+_RETRYABLE_EXCEPTIONS = (
+    FipeRateLimitError,
+    aiohttp.ClientConnectionError,
+    asyncio.TimeoutError
+)
+
+if httpx is not None:
+    _RETRYABLE_EXCEPTIONS = _RETRYABLE_EXCEPTIONS + (httpx.TransportError,)
+
+
+# Contexto TLS compartilhado por todas as conexões: session tickets são
+# reaproveitados entre conexões, evitando o handshake completo (~100ms)
+# a cada conexão nova do pool.
+_SSL_CTX = ssl.create_default_context()
+
+
+class AsyncFipeClient:
+    """
+    Cliente assíncrono para comunicação com a API FIPE.
+    Mantém uma única ClientSession com pool de conexões keep-alive,
+    permitindo que o orquestrador dispare consultas concorrentes.
+
+    Uso:
+        async with AsyncFipeClient() as client:
+            periods = await client.get_reference_tables()
+    """
+
+    def __init__(self, cache: Optional[ResponseCache] = None):
+        """
+        Inicializa o cliente com as configurações do ambiente.
+        A sessão HTTP só é criada em __aenter__ (precisa de event loop).
+
+        Args:
+            cache: Cache de respostas opcional (MemoryCache ou DiskCache).
+                   Consultas de períodos históricos são servidas do cache
+                   sem nova requisição. Quando omitido, usa o DiskCache
+                   compartilhado do processo (ver Config.USE_RESPONSE_CACHE).
+        """
+        self.cache = cache if cache is not None else get_default_cache()
+        self.base_url = Config.FIPE_BASE_URL
+
+        # URLs completas pré-concatenadas para os endpoints conhecidos
+        self._urls = {
+            endpoint: f"{self.base_url}{endpoint}"
+            for endpoint in Endpoints.all_endpoints()
+        }
+        self.headers = Config.get_headers()
+        self.timeout = Config.REQUEST_TIMEOUT
+        self.delay = Config.DELAY_BETWEEN_REQUESTS
+        self._next_allowed = 0.0
+        self._sem = asyncio.Semaphore(Config.MAX_CONCURRENT)
+        self._session = None
+        self._is_httpx = False
+        self._batch_queue: Deque[Tuple[str, Dict[str, Any], asyncio.Future]] = deque()
+        self._batch_task: Optional[asyncio.Task] = None
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+    async def _ensure_session(self):
+        """
+        Garante que a sessão HTTP existe, criando-a se necessário.
+        Prefere httpx com HTTP/2 (multiplexação de streams em uma única
+        conexão TLS); cai para aiohttp/HTTP1.1 keep-alive se httpx ou o
+        pacote h2 não estiverem instalados.
+
+        Returns:
+            Sessão ativa (httpx.AsyncClient ou aiohttp.ClientSession)
+        """
+        if self._session is not None and not self._session_closed():
+            return self._session
+
+        if httpx is not None:
+            try:
+                self._session = httpx.AsyncClient(
+                    http2=True,
+                    verify=_SSL_CTX,
+                    headers=dict(self.headers),
+                    timeout=self.timeout,
+                    limits=httpx.Limits(
+                        max_connections=100,
+                        max_keepalive_connections=20
+                    )
+                )
+                self._is_httpx = True
+                return self._session
+            except ImportError:
+                logger.warning(
+                    "httpx instalado sem suporte a HTTP/2 (pacote h2 ausente); "
+                    "usando aiohttp"
+                )
+
+        connector = aiohttp.TCPConnector(
+            ssl=_SSL_CTX,
+            ttl_dns_cache=3600,
+            limit=100,
+            limit_per_host=64,
+            keepalive_timeout=75,
+            force_close=False,
+            enable_cleanup_closed=True
+        )
+        self._session = aiohttp.ClientSession(
+            headers=self.headers,
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        self._is_httpx = False
+        return self._session
+
+    def _session_closed(self) -> bool:
+        """Indica se a sessão atual já foi fechada."""
+        if self._session is None:
+            return True
+        if self._is_httpx:
+            return self._session.is_closed
+        return self._session.closed
+
+    async def _post(
+        self,
+        url: str,
+        payload: Dict[str, Any]
+    ) -> Tuple[int, bytes, Mapping[str, str]]:
+        """
+        Executa o POST no transporte ativo.
+
+        Args:
+            url: URL completa do endpoint
+            payload: Corpo da requisição
+
+        Returns:
+            Tuple[int, bytes, Mapping]: (status, corpo bruto, headers)
+        """
+        session = await self._ensure_session()
+
+        if self._is_httpx:
+            response = await session.post(url, json=payload)
+            return response.status_code, response.content, response.headers
+
+        async with session.post(url, json=payload) as response:
+            return response.status, await response.read(), response.headers
+
+    async def _wait_for_rate_limit(self) -> None:
+        """
+        Aguarda o tempo necessário para respeitar o rate limit.
+        Funciona como um token bucket compartilhado: cada corrotina reserva
+        o próximo instante permitido e dorme com asyncio.sleep, sem bloquear
+        as demais.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+
+        wait = self._next_allowed - now
+        self._next_allowed = max(self._next_allowed, now) + self.delay
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _push_back_rate_limit(self, retry_after: Optional[str]) -> None:
+        """
+        Empurra a janela de rate limit para frente após um 429,
+        atrasando todas as corrotinas de uma vez.
+
+        Args:
+            retry_after: Valor do header Retry-After, se presente
+        """
+        loop = asyncio.get_running_loop()
+
+        try:
+            delay = float(retry_after) if retry_after else self.delay * 2
+        except ValueError:
+            delay = self.delay * 2
+
+        self._next_allowed = max(self._next_allowed, loop.time() + delay)
+
+    async def _make_request(
+        self,
+        endpoint: str,
+        payload: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Realiza uma requisição POST assíncrona para a API FIPE,
+        com retry inline de backoff exponencial com jitter.
+
+        O loop inline substitui o decorator do tenacity: uma frame a menos
+        por requisição, estado de retry por corrotina e jitter aleatório
+        para que corrotinas bloqueadas por 429 não re-disparem em uníssono.
+
+        Args:
+            endpoint: Nome do endpoint
+            payload: Dados para enviar no corpo da requisição
+
+        Returns:
+            Any: Resposta da API (dict ou list)
+
+        Raises:
+            FipeRateLimitError: Se o rate limit for atingido
+            FipeRequestError: Se houver erro na requisição
+        """
+        cache_key = None
+        if self.cache is not None and endpoint in ENDPOINT_TTL:
+            cache_key = make_cache_key(endpoint, payload)
+            cached = self.cache.get(cache_key, ttl=ENDPOINT_TTL[endpoint])
+            if cached is not None:
+                logger.debug(f"Cache hit para {endpoint}")
+                return cached
+
+        url = self._urls.get(endpoint) or f"{self.base_url}{endpoint}"
+
+        # Single-flight: corrotinas concorrentes com requisição idêntica
+        # aguardam a mesma Future em vez de disparar N POSTs duplicados.
+        inflight_key = (endpoint, tuple(sorted((payload or {}).items())))
+        pending = self._inflight.get(inflight_key)
+
+        if pending is not None:
+            logger.debug(f"Requisição coalescida para {endpoint}")
+            return await pending
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[inflight_key] = future
+
+        try:
+            for attempt in range(Config.MAX_RETRIES):
+                try:
+                    data = await self._request_once(endpoint, url, payload)
+                    break
+                except _RETRYABLE_EXCEPTIONS as e:
+                    if attempt + 1 >= Config.MAX_RETRIES:
+                        raise
+
+                    backoff = min(
+                        Config.MAX_BACKOFF,
+                        Config.INITIAL_BACKOFF
+                        * Config.BACKOFF_MULTIPLIER ** attempt
+                    ) * random.uniform(0.5, 1.5)
+
+                    logger.info(
+                        f"Tentativa {attempt + 1}/{Config.MAX_RETRIES} falhou "
+                        f"para {endpoint} ({e}); aguardando {backoff:.1f}s"
+                    )
+                    await asyncio.sleep(backoff)
+        except BaseException as e:
+            future.set_exception(e)
+            # Marca a exceção como consumida mesmo sem outros aguardantes
+            future.exception()
+            raise
+        else:
+            future.set_result(data)
+        finally:
+            self._inflight.pop(inflight_key, None)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, data)
+
+        return data
+
+    async def _request_once(
+        self,
+        endpoint: str,
+        url: str,
+        payload: Optional[Dict[str, Any]]
+    ) -> Any:
+        """
+        Executa uma única tentativa de requisição, sem retry.
+
+        Args:
+            endpoint: Nome do endpoint (para logs)
+            url: URL completa
+            payload: Corpo da requisição
+
+        Returns:
+            Any: Resposta da API já parseada
+        """
+        async with self._sem:
+            await self._wait_for_rate_limit()
+
+            try:
+                status, body, headers = await self._post(url, payload or {})
+            except asyncio.TimeoutError:
+                logger.warning(f"Timeout na requisição para {endpoint}")
+                raise
+            except _RETRYABLE_EXCEPTIONS as e:
+                logger.warning(f"Erro de conexão para {endpoint}: {e}")
+                raise
+
+            # Verifica rate limit (status 429)
+            if status == 429:
+                logger.warning(f"Rate limit atingido no endpoint {endpoint}")
+                self._push_back_rate_limit(headers.get("Retry-After"))
+                raise FipeRateLimitError("Rate limit atingido")
+
+            snippet = body[:200].decode("utf-8", errors="replace")
+
+            # Verifica outros erros HTTP
+            if status != 200:
+                logger.error(
+                    f"Erro HTTP {status} no endpoint {endpoint}: {snippet}"
+                )
+
+                # Se for erro de servidor, tenta novamente
+                if status >= 500:
+                    raise FipeRateLimitError(f"Erro de servidor: {status}")
+
+                raise FipeRequestError(f"Erro HTTP {status}: {snippet}")
+
+            # Tenta parsear o JSON (orjson decodifica em C direto dos bytes)
+            try:
+                data = orjson.loads(body)
+            except ValueError as e:
+                logger.error(f"Erro ao parsear JSON do endpoint {endpoint}: {e}")
+                raise FipeRequestError(f"Resposta inválida: {snippet}")
+
+        # Verifica se há erro na resposta da API
+        if isinstance(data, dict) and "erro" in data:
+            error_msg = data.get("erro", "Erro desconhecido")
+            logger.warning(f"Erro na API FIPE: {error_msg}")
+
+            # Alguns erros indicam rate limiting
+            if "timeout" in error_msg.lower() or "blocked" in error_msg.lower():
+                raise FipeRateLimitError(error_msg)
+
+            raise FipeRequestError(error_msg)
+
+        return data
+
+    def _enqueue(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any]
+    ) -> "asyncio.Future":
+        """
+        Enfileira uma requisição para despacho em lote.
+
+        As requisições acumuladas dentro da janela BATCH_WINDOW são
+        agrupadas em lotes de até BATCH_SIZE e disparadas de forma
+        concorrente, amortizando a latência de ida e volta.
+
+        Args:
+            endpoint: Nome do endpoint
+            payload: Dados da requisição
+
+        Returns:
+            asyncio.Future: Future resolvida com a resposta da API
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._batch_queue.append((endpoint, payload, future))
+
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = loop.create_task(self._drain_batch_queue())
+
+        return future
+
+    async def _drain_batch_queue(self) -> None:
+        """
+        Tarefa de fundo que drena a fila de requisições em lotes.
+        Encerra sozinha quando a fila esvazia.
+        """
+        while self._batch_queue:
+            await asyncio.sleep(BATCH_WINDOW)
+
+            batch = []
+            while self._batch_queue and len(batch) < BATCH_SIZE:
+                batch.append(self._batch_queue.popleft())
+
+            if batch:
+                await self._dispatch_batch(batch)
+
+    async def _dispatch_batch(
+        self,
+        batch: list
+    ) -> None:
+        """
+        Dispara um lote de requisições concorrentes e roteia cada
+        resultado (ou exceção) de volta para a Future correspondente.
+
+        Args:
+            batch: Lista de tuplas (endpoint, payload, future)
+        """
+        results = await asyncio.gather(
+            *[self._make_request(endpoint, payload) for endpoint, payload, _ in batch],
+            return_exceptions=True
+        )
+
+        for (_, _, future), result in zip(batch, results):
+            if future.cancelled():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def enqueue_year_models(
+        self,
+        reference_table_code: int,
+        vehicle_type: int,
+        brand_code: int,
+        model_code: int
+    ) -> "asyncio.Future":
+        """
+        Enfileira uma consulta de anos-modelo para despacho em lote.
+
+        Args:
+            reference_table_code: Código da tabela de referência
+            vehicle_type: Código do tipo de veículo
+            brand_code: Código da marca
+            model_code: Código do modelo
+
+        Returns:
+            asyncio.Future: Future resolvida com a lista de anos-modelo
+        """
+        payload = self._year_models_payload(
+            reference_table_code, vehicle_type, brand_code, model_code
+        )
+        return self._enqueue(Endpoints.YEAR_MODELS, payload)
+
+    def enqueue_fipe_value(
+        self,
+        reference_table_code: int,
+        vehicle_type: int,
+        brand_code: int,
+        model_code: int,
+        year_model: str,
+        fuel_type_code: int = 1,
+        year_tuple: Optional[tuple] = None
+    ) -> "asyncio.Future":
+        """
+        Enfileira uma consulta de valor FIPE para despacho em lote.
+
+        Args:
+            reference_table_code: Código da tabela de referência
+            vehicle_type: Código do tipo de veículo
+            brand_code: Código da marca
+            model_code: Código do modelo
+            year_model: Código do ano-modelo (ex: "2024-1")
+            fuel_type_code: Código do tipo de combustível (padrão: 1)
+            year_tuple: Tupla (ano, combustível) pré-calculada (opcional)
+
+        Returns:
+            asyncio.Future: Future resolvida com os dados do valor FIPE
+        """
+        payload = self._fipe_value_payload(
+            reference_table_code, vehicle_type, brand_code, model_code,
+            year_model, fuel_type_code, year_tuple
+        )
+        return self._enqueue(Endpoints.FIPE_VALUE, payload)
+
+    @staticmethod
+    def _year_models_payload(
+        reference_table_code: int,
+        vehicle_type: int,
+        brand_code: int,
+        model_code: int
+    ) -> Dict[str, Any]:
+        """Monta o payload da consulta de anos-modelo."""
+        return dict(zip(
+            YEAR_MODELS_PAYLOAD_KEYS,
+            (reference_table_code, vehicle_type, brand_code, model_code)
+        ))
+
+    @staticmethod
+    def _fipe_value_payload(
+        reference_table_code: int,
+        vehicle_type: int,
+        brand_code: int,
+        model_code: int,
+        year_model: str,
+        fuel_type_code: int = 1,
+        year_tuple: Optional[tuple] = None
+    ) -> Dict[str, Any]:
+        """Monta o payload da consulta de valor FIPE."""
+        if year_tuple is not None:
+            ano_modelo, tipo_combustivel = year_tuple
+        else:
+            # Separa ano e combustível do código
+            year_parts = year_model.split("-")
+            ano_modelo = year_parts[0]
+            tipo_combustivel = int(year_parts[1]) if len(year_parts) > 1 else fuel_type_code
+
+        return dict(zip(
+            FIPE_VALUE_PAYLOAD_KEYS,
+            (reference_table_code, vehicle_type, brand_code, model_code,
+             ano_modelo, tipo_combustivel, "tradicional")
+        ))
+
+    async def get_reference_tables(self) -> list:
+        """
+        Obtém todas as tabelas de referência (períodos) disponíveis.
+
+        Returns:
+            list: Lista de períodos de referência
+                  [{"Codigo": 1, "Mes": "janeiro/2024"}, ...]
+        """
+        logger.info("Consultando tabelas de referência...")
+        return await self._make_request(Endpoints.REFERENCE_TABLES)
+
+    async def get_brands(
+        self,
+        reference_table_code: int,
+        vehicle_type: int
+    ) -> list:
+        """
+        Obtém todas as marcas para um tipo de veículo em um período.
+
+        Args:
+            reference_table_code: Código da tabela de referência
+            vehicle_type: Código do tipo de veículo (1=carro, 2=moto, 3=caminhão)
+
+        Returns:
+            list: Lista de marcas [{"Label": "FIAT", "Value": "21"}, ...]
+        """
+        logger.debug(
+            f"Consultando marcas - Ref: {reference_table_code}, Tipo: {vehicle_type}"
+        )
+
+        payload = {
+            "codigoTabelaReferencia": reference_table_code,
+            "codigoTipoVeiculo": vehicle_type
+        }
+
+        return await self._make_request(Endpoints.BRANDS, payload)
+
+    async def get_models(
+        self,
+        reference_table_code: int,
+        vehicle_type: int,
+        brand_code: int
+    ) -> Dict[str, Any]:
+        """
+        Obtém todos os modelos de uma marca.
+
+        Args:
+            reference_table_code: Código da tabela de referência
+            vehicle_type: Código do tipo de veículo
+            brand_code: Código da marca
+
+        Returns:
+            Dict: {"Modelos": [...], "Anos": [...]}
+        """
+        logger.debug(
+            f"Consultando modelos - Ref: {reference_table_code}, "
+            f"Tipo: {vehicle_type}, Marca: {brand_code}"
+        )
+
+        payload = {
+            "codigoTabelaReferencia": reference_table_code,
+            "codigoTipoVeiculo": vehicle_type,
+            "codigoMarca": brand_code
+        }
+
+        return await self._make_request(Endpoints.MODELS, payload)
+
+    async def get_year_models(
+        self,
+        reference_table_code: int,
+        vehicle_type: int,
+        brand_code: int,
+        model_code: int
+    ) -> list:
+        """
+        Obtém todos os anos-modelo de um modelo específico.
+
+        Args:
+            reference_table_code: Código da tabela de referência
+            vehicle_type: Código do tipo de veículo
+            brand_code: Código da marca
+            model_code: Código do modelo
+
+        Returns:
+            list: Lista de anos-modelo [{"Label": "2024", "Value": "2024-1"}, ...]
+        """
+        logger.debug(
+            f"Consultando anos-modelo - Modelo: {model_code}"
+        )
+
+        payload = self._year_models_payload(
+            reference_table_code, vehicle_type, brand_code, model_code
+        )
+
+        return await self._make_request(Endpoints.YEAR_MODELS, payload)
+
+    async def get_fipe_value(
+        self,
+        reference_table_code: int,
+        vehicle_type: int,
+        brand_code: int,
+        model_code: int,
+        year_model: str,
+        fuel_type_code: int = 1,
+        year_tuple: Optional[tuple] = None
+    ) -> Dict[str, Any]:
+        """
+        Obtém o valor FIPE de um veículo específico.
+
+        Args:
+            reference_table_code: Código da tabela de referência
+            vehicle_type: Código do tipo de veículo
+            brand_code: Código da marca
+            model_code: Código do modelo
+            year_model: Código do ano-modelo (ex: "2024-1")
+            fuel_type_code: Código do tipo de combustível (padrão: 1)
+            year_tuple: Tupla (ano, combustível) pré-calculada (opcional)
+
+        Returns:
+            Dict: Dados completos do valor FIPE
+        """
+        logger.debug(
+            f"Consultando valor FIPE - Modelo: {model_code}, Ano: {year_model}"
+        )
+
+        payload = self._fipe_value_payload(
+            reference_table_code, vehicle_type, brand_code, model_code,
+            year_model, fuel_type_code, year_tuple
+        )
+
+        return await self._make_request(Endpoints.FIPE_VALUE, payload)
+
+    async def close(self) -> None:
+        """
+        Fecha a sessão HTTP, drenando antes os lotes pendentes.
+        """
+        if self._batch_task is not None and not self._batch_task.done():
+            await self._batch_task
+
+        if self._session is not None and not self._session_closed():
+            if self._is_httpx:
+                await self._session.aclose()
+            else:
+                await self._session.close()
+            logger.debug("Sessão HTTP assíncrona fechada")
+
+    async def _warm_up(self) -> None:
+        """
+        Envia uma requisição de aquecimento para o host da FIPE, pagando o
+        handshake TCP+TLS antes do fan-out. Melhor esforço: falhas são
+        ignoradas.
+        """
+        session = await self._ensure_session()
+
+        try:
+            if self._is_httpx:
+                await session.head(self.base_url)
+            else:
+                async with session.head(
+                    self.base_url, allow_redirects=False
+                ):
+                    pass
+            logger.debug("Conexão pré-aquecida com o host FIPE")
+        except Exception as e:
+            logger.debug(f"Pré-aquecimento de conexão falhou (ignorado): {e}")
+
+    async def __aenter__(self):
+        """Cria a sessão e pré-aquece a conexão com o host."""
+        await self._ensure_session()
+        await self._warm_up()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Fecha a sessão ao sair do context manager."""
+        await self.close()
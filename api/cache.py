@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+Cache de respostas da API FIPE.
+
+Tabelas de referência fechadas nunca mudam, então marcas, modelos e
+valores consultados para períodos históricos podem ser reaproveitados
+entre execuções sem nova ida à rede.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+
+from api.endpoints import Endpoints
+from utils.logger import setup_logger
+
+
+logger = setup_logger("response_cache")
+
+
+# TTL por endpoint, em segundos. None significa que a resposta é imutável
+# (períodos já fechados não são reprocessados pela FIPE). Endpoints fora
+# do dicionário NÃO são cacheados: a listagem de tabelas de referência é o
+# ponto de descoberta de novos períodos — servida do cache, uma tabela
+# mensal recém-publicada ficaria invisível para o scraper inteiro.
+ENDPOINT_TTL = {
+    Endpoints.BRANDS: None,
+    Endpoints.MODELS: None,
+    Endpoints.YEAR_MODELS: None,
+    Endpoints.FIPE_VALUE: None
+}
+
+
+def make_cache_key(endpoint: str, payload: Optional[Dict[str, Any]]) -> str:
+    """
+    Gera a chave de cache determinística de uma requisição.
+
+    Args:
+        endpoint: Nome do endpoint
+        payload: Corpo da requisição
+
+    Returns:
+        str: Hash hexadecimal de (endpoint, payload ordenado)
+    """
+    digest = blake2b(digest_size=16)
+    digest.update(endpoint.encode("utf-8"))
+    digest.update(orjson.dumps(payload or {}, option=orjson.OPT_SORT_KEYS))
+    return digest.hexdigest()
+
+
+class ResponseCache(ABC):
+    """
+    Interface comum dos backends de cache de respostas.
+    """
+
+    @abstractmethod
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """
+        Busca uma resposta no cache.
+
+        Args:
+            key: Chave gerada por make_cache_key
+            ttl: Validade máxima em segundos (None = sem expiração)
+
+        Returns:
+            Optional[Any]: Resposta armazenada ou None se ausente/expirada
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """
+        Armazena uma resposta no cache.
+
+        Args:
+            key: Chave gerada por make_cache_key
+            value: Resposta da API (estrutura serializável em JSON)
+        """
+        pass
+
+
+class MemoryCache(ResponseCache):
+    """
+    Cache em memória com descarte LRU.
+    Útil para deduplicar consultas repetidas dentro de uma mesma execução.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        """
+        Inicializa o cache em memória.
+
+        Args:
+            max_entries: Número máximo de respostas retidas
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+
+        if ttl is not None and time.time() - stored_at > ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.time(), value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class DiskCache(ResponseCache):
+    """
+    Cache persistente em SQLite, compartilhável entre execuções.
+
+    Seguro para uso a partir de múltiplas threads (os clientes fazem
+    fan-out em ThreadPoolExecutor) e tolerante a múltiplos processos
+    gravando no mesmo arquivo (modo WAL + timeout de lock).
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Inicializa o cache em disco.
+
+        Args:
+            db_path: Caminho do banco SQLite (padrão: output/fipe_cache.db)
+        """
+        if db_path is None:
+            from utils.config import Config
+            db_path = Config.get_output_path("fipe_cache.db")
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(db_path),
+            check_same_thread=False,
+            timeout=30.0
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, stored_at REAL, value BLOB)"
+        )
+        self._conn.commit()
+
+        logger.debug(f"Cache em disco inicializado: {db_path}")
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at, value FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            stored_at, value = row
+
+            if ttl is not None and time.time() - stored_at > ttl:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key = ?", (key,)
+                )
+                self._conn.commit()
+                return None
+
+        return orjson.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, stored_at, value) "
+                "VALUES (?, ?, ?)",
+                (key, time.time(), orjson.dumps(value))
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        self._conn.close()
+
+
+# Cache padrão compartilhado pelo processo: uma única conexão SQLite
+# serve todos os clientes criados sem cache explícito. O PID de criação é
+# guardado porque conexões SQLite não podem atravessar fork(): um worker
+# que herde o singleton do pai precisa abrir a própria conexão.
+_default_cache: Optional[DiskCache] = None
+_default_cache_pid: Optional[int] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> Optional[ResponseCache]:
+    """
+    Retorna o cache em disco padrão do processo, se habilitado.
+
+    Controlado por Config.USE_RESPONSE_CACHE (variável de ambiente
+    USE_RESPONSE_CACHE). A instância é criada na primeira chamada e
+    compartilhada por todos os clientes do processo, de modo que uma
+    reexecução reaproveita as respostas de períodos já fechados sem
+    nova ida à rede.
+
+    Returns:
+        Optional[ResponseCache]: DiskCache compartilhado ou None se
+        o cache estiver desabilitado
+    """
+    from utils.config import Config
+
+    if not Config.USE_RESPONSE_CACHE:
+        return None
+
+    global _default_cache, _default_cache_pid
+    with _default_cache_lock:
+        # Recria o singleton após fork(): usar a conexão herdada do pai é
+        # o cenário documentado de corrupção do SQLite. Cada processo abre
+        # a própria conexão; WAL + busy timeout cuidam da exclusão entre
+        # processos no mesmo arquivo.
+        pid = os.getpid()
+        if _default_cache is None or _default_cache_pid != pid:
+            _default_cache = DiskCache()
+            _default_cache_pid = pid
+        return _default_cache
@@ -25,6 +25,62 @@ class Endpoints:
     # Endpoint para consultar valor FIPE completo
     FIPE_VALUE = "ConsultarValorComTodosParametros"
 
+    @classmethod
+    def all_endpoints(cls) -> tuple:
+        """
+        Retorna todos os nomes de endpoints conhecidos.
+
+        Returns:
+            tuple: Nomes dos endpoints
+        """
+        return (
+            cls.REFERENCE_TABLES,
+            cls.BRANDS,
+            cls.MODELS,
+            cls.YEAR_MODELS,
+            cls.FIPE_VALUE
+        )
+
+
+# Chaves dos payloads mais quentes, na ordem posicional dos argumentos.
+# dict(zip(...)) com uma tupla constante evita re-hashear literais de
+# string a cada construção de payload.
+YEAR_MODELS_PAYLOAD_KEYS = (
+    "codigoTabelaReferencia",
+    "codigoTipoVeiculo",
+    "codigoMarca",
+    "codigoModelo"
+)
+
+FIPE_VALUE_PAYLOAD_KEYS = (
+    "codigoTabelaReferencia",
+    "codigoTipoVeiculo",
+    "codigoMarca",
+    "codigoModelo",
+    "anoModelo",
+    "codigoTipoCombustivel",
+    "tipoConsulta"
+)
+
+
+# Mapeamentos construídos uma única vez na importação do módulo;
+# from_string/to_string são chamados uma vez por registro ingerido.
+_VEHICLE_FROM_STRING = {
+    "car": 1,
+    "carro": 1,
+    "bike": 2,
+    "moto": 2,
+    "truck": 3,
+    "caminhao": 3,
+    "caminhão": 3
+}
+
+_VEHICLE_TO_STRING = {
+    1: "car",
+    2: "bike",
+    3: "truck"
+}
+
 
 class VehicleType:
     """
@@ -49,25 +105,15 @@ class VehicleType:
         Raises:
             ValueError: Se o tipo de veículo for inválido
         """
-        mapping = {
-            "car": cls.CAR,
-            "carro": cls.CAR,
-            "bike": cls.BIKE,
-            "moto": cls.BIKE,
-            "truck": cls.TRUCK,
-            "caminhao": cls.TRUCK,
-            "caminhão": cls.TRUCK
-        }
-
-        normalized = vehicle_type.lower().strip()
-
-        if normalized not in mapping:
+        code = _VEHICLE_FROM_STRING.get(vehicle_type.strip().lower())
+
+        if code is None:
             raise ValueError(
                 f"Tipo de veículo inválido: {vehicle_type}. "
-                f"Valores válidos: {list(mapping.keys())}"
+                f"Valores válidos: {list(_VEHICLE_FROM_STRING.keys())}"
             )
 
-        return mapping[normalized]
+        return code
 
     @classmethod
     def to_string(cls, vehicle_code: int) -> str:
@@ -80,13 +126,7 @@ class VehicleType:
         Returns:
             str: Nome do tipo de veículo em inglês
         """
-        mapping = {
-            cls.CAR: "car",
-            cls.BIKE: "bike",
-            cls.TRUCK: "truck"
-        }
-
-        return mapping.get(vehicle_code, "unknown")
+        return _VEHICLE_TO_STRING.get(vehicle_code, "unknown")
 
     @classmethod
     def all_types(cls) -> list:
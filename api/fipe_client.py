@@ -4,10 +4,14 @@ Cliente HTTP para comunicação com a API FIPE.
 Implementa retry com exponential backoff e rate limiting.
 """
 
+import socket
+import threading
 import time
 from typing import Any, Dict, Optional
 
+import orjson
 import requests
+from urllib3.connection import HTTPConnection
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -18,7 +22,17 @@ from tenacity import (
 
 from utils.config import Config
 from utils.logger import setup_logger
-from api.endpoints import Endpoints
+from api.endpoints import (
+    Endpoints,
+    FIPE_VALUE_PAYLOAD_KEYS,
+    YEAR_MODELS_PAYLOAD_KEYS
+)
+from api.cache import (
+    ENDPOINT_TTL,
+    ResponseCache,
+    get_default_cache,
+    make_cache_key
+)
 
 
 logger = setup_logger("fipe_client")
@@ -39,35 +53,112 @@ class FipeRequestError(FipeClientError):
     pass
 
 
+class _LowLatencyAdapter(requests.adapters.HTTPAdapter):
+    """
+    HTTPAdapter com TCP_NODELAY habilitado nos sockets do pool.
+    Os POSTs da FIPE são pequenos; desabilitar o algoritmo de Nagle evita
+    que o kernel segure o envio aguardando mais dados.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+
 class FipeClient:
     """
     Cliente para comunicação com a API FIPE.
     Implementa retry com exponential backoff para lidar com bloqueios.
     """
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ResponseCache] = None):
         """
         Inicializa o cliente com as configurações do ambiente.
+
+        Args:
+            cache: Cache de respostas opcional (MemoryCache ou DiskCache).
+                   Consultas de períodos históricos são servidas do cache
+                   sem nova requisição. Quando omitido, usa o DiskCache
+                   compartilhado do processo (ver Config.USE_RESPONSE_CACHE).
         """
+        self.cache = cache if cache is not None else get_default_cache()
         self.base_url = Config.FIPE_BASE_URL
         self.headers = Config.get_headers()
         self.timeout = Config.REQUEST_TIMEOUT
         self.delay = Config.DELAY_BETWEEN_REQUESTS
-        self._last_request_time = 0
+
+        # Reserva de slot do rate limit (ver _wait_for_rate_limit): o
+        # horário do próximo slot livre é atualizado sob lock porque o
+        # mesmo cliente é compartilhado por várias threads nos fan-outs.
+        self._next_allowed = 0.0
+        self._rate_lock = threading.Lock()
+
+        # Memo em memória de get_models por (período, tipo, marca): os
+        # fluxos de orquestração repetem a mesma consulta para marcas
+        # presentes em vários períodos, e a lista de modelos não muda
+        # dentro de uma execução.
+        self._models_memo: Dict[tuple, Any] = {}
+
+        # URLs completas pré-concatenadas: evita refazer o f-string
+        # base_url+endpoint em cada uma das milhões de requisições.
+        self._urls = {
+            endpoint: f"{self.base_url}{endpoint}"
+            for endpoint in Endpoints.all_endpoints()
+        }
+
         self._session = requests.Session()
         self._session.headers.update(self.headers)
+        self._session.headers["Connection"] = "keep-alive"
+
+        # Pool de conexões dimensionado para MAX_WORKERS threads concorrentes;
+        # o padrão do requests (pool_maxsize=10) descarta sockets excedentes
+        # e refaz o handshake TCP+TLS sob carga.
+        adapter = _LowLatencyAdapter(
+            pool_connections=Config.MAX_WORKERS,
+            pool_maxsize=Config.MAX_WORKERS * 2,
+            max_retries=0
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # Pré-aquece a conexão: o handshake TCP+TLS acontece aqui, antes do
+        # fan-out, em vez de atrasar a primeira consulta real.
+        self._warm_up()
+
+    def _warm_up(self) -> None:
+        """
+        Envia uma requisição HEAD de aquecimento para o host da FIPE.
+        Melhor esforço: falhas são ignoradas (a primeira consulta real
+        paga o handshake normalmente).
+        """
+        try:
+            self._session.head(
+                self.base_url,
+                timeout=min(self.timeout, 5)
+            )
+            logger.debug("Conexão pré-aquecida com o host FIPE")
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Pré-aquecimento de conexão falhou (ignorado): {e}")
 
     def _wait_for_rate_limit(self) -> None:
         """
         Aguarda o tempo necessário para respeitar o rate limit.
-        """
-        elapsed = time.time() - self._last_request_time
 
-        if elapsed < self.delay:
-            sleep_time = self.delay - elapsed
-            time.sleep(sleep_time)
+        Mesmo esquema de reserva de slot do cliente assíncrono: cada
+        thread reserva o próximo horário livre sob lock e dorme fora
+        dele, de modo que o processo inteiro mantém um intervalo de
+        delay entre requisições — sem o lock, threads concorrentes liam
+        o mesmo timestamp, dormiam o mesmo tanto e disparavam juntas.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_allowed - now
+            self._next_allowed = max(self._next_allowed, now) + self.delay
 
-        self._last_request_time = time.time()
+        if wait > 0:
+            time.sleep(wait)
 
     @retry(
         stop=stop_after_attempt(Config.MAX_RETRIES),
@@ -102,9 +193,17 @@ class FipeClient:
             FipeRateLimitError: Se o rate limit for atingido
             FipeRequestError: Se houver erro na requisição
         """
+        cache_key = None
+        if self.cache is not None and endpoint in ENDPOINT_TTL:
+            cache_key = make_cache_key(endpoint, payload)
+            cached = self.cache.get(cache_key, ttl=ENDPOINT_TTL[endpoint])
+            if cached is not None:
+                logger.debug(f"Cache hit para {endpoint}")
+                return cached
+
         self._wait_for_rate_limit()
 
-        url = f"{self.base_url}{endpoint}"
+        url = self._urls.get(endpoint) or f"{self.base_url}{endpoint}"
 
         try:
             response = self._session.post(
@@ -133,9 +232,10 @@ class FipeClient:
                     f"Erro HTTP {response.status_code}: {response.text[:200]}"
                 )
 
-            # Tenta parsear o JSON
+            # Tenta parsear o JSON (orjson decodifica em C direto dos bytes,
+            # sem o sniffing de charset do response.json())
             try:
-                data = response.json()
+                data = orjson.loads(response.content)
             except ValueError as e:
                 logger.error(f"Erro ao parsear JSON do endpoint {endpoint}: {e}")
                 raise FipeRequestError(f"Resposta inválida: {response.text[:200]}")
@@ -151,6 +251,9 @@ class FipeClient:
 
                 raise FipeRequestError(error_msg)
 
+            if cache_key is not None:
+                self.cache.set(cache_key, data)
+
             return data
 
         except requests.exceptions.Timeout:
@@ -214,6 +317,11 @@ class FipeClient:
         Returns:
             Dict: {"Modelos": [...], "Anos": [...]}
         """
+        memo_key = (reference_table_code, vehicle_type, brand_code)
+        cached = self._models_memo.get(memo_key)
+        if cached is not None:
+            return cached
+
         logger.debug(
             f"Consultando modelos - Ref: {reference_table_code}, "
             f"Tipo: {vehicle_type}, Marca: {brand_code}"
@@ -225,7 +333,15 @@ class FipeClient:
             "codigoMarca": brand_code
         }
 
-        return self._make_request(Endpoints.MODELS, payload)
+        result = self._make_request(Endpoints.MODELS, payload)
+
+        # Limite defensivo: ~100 marcas x 3 tipos x dezenas de períodos
+        # cabem folgados; acima disso, para de memoizar em vez de crescer
+        # sem teto.
+        if len(self._models_memo) < 4096:
+            self._models_memo[memo_key] = result
+
+        return result
 
     def get_year_models(
         self,
@@ -250,12 +366,10 @@ class FipeClient:
             f"Consultando anos-modelo - Modelo: {model_code}"
         )
 
-        payload = {
-            "codigoTabelaReferencia": reference_table_code,
-            "codigoTipoVeiculo": vehicle_type,
-            "codigoMarca": brand_code,
-            "codigoModelo": model_code
-        }
+        payload = dict(zip(
+            YEAR_MODELS_PAYLOAD_KEYS,
+            (reference_table_code, vehicle_type, brand_code, model_code)
+        ))
 
         return self._make_request(Endpoints.YEAR_MODELS, payload)
 
@@ -266,7 +380,8 @@ class FipeClient:
         brand_code: int,
         model_code: int,
         year_model: str,
-        fuel_type_code: int = 1
+        fuel_type_code: int = 1,
+        year_tuple: Optional[tuple] = None
     ) -> Dict[str, Any]:
         """
         Obtém o valor FIPE de um veículo específico.
@@ -278,6 +393,8 @@ class FipeClient:
             model_code: Código do modelo
             year_model: Código do ano-modelo (ex: "2024-1")
             fuel_type_code: Código do tipo de combustível (padrão: 1)
+            year_tuple: Tupla (ano, combustível) pré-calculada no YearModel;
+                        quando presente, evita refazer o split do código
 
         Returns:
             Dict: Dados completos do valor FIPE
@@ -286,20 +403,19 @@ class FipeClient:
             f"Consultando valor FIPE - Modelo: {model_code}, Ano: {year_model}"
         )
 
-        # Separa ano e combustível do código
-        year_parts = year_model.split("-")
-        ano_modelo = year_parts[0]
-        tipo_combustivel = int(year_parts[1]) if len(year_parts) > 1 else fuel_type_code
-
-        payload = {
-            "codigoTabelaReferencia": reference_table_code,
-            "codigoTipoVeiculo": vehicle_type,
-            "codigoMarca": brand_code,
-            "codigoModelo": model_code,
-            "anoModelo": ano_modelo,
-            "codigoTipoCombustivel": tipo_combustivel,
-            "tipoConsulta": "tradicional"
-        }
+        if year_tuple is not None:
+            ano_modelo, tipo_combustivel = year_tuple
+        else:
+            # Separa ano e combustível do código
+            year_parts = year_model.split("-")
+            ano_modelo = year_parts[0]
+            tipo_combustivel = int(year_parts[1]) if len(year_parts) > 1 else fuel_type_code
+
+        payload = dict(zip(
+            FIPE_VALUE_PAYLOAD_KEYS,
+            (reference_table_code, vehicle_type, brand_code, model_code,
+             ano_modelo, tipo_combustivel, "tradicional")
+        ))
 
         return self._make_request(Endpoints.FIPE_VALUE, payload)
 
@@ -21,10 +21,11 @@ Uso:
     scraper.run()
 """
 
-import json
+import re
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
+from api.endpoints import VehicleType
 from scrapers.orchestrator import Orchestrator
 from models.fipe_models import ExtractionResult
 from utils.config import Config
@@ -35,6 +36,11 @@ from utils.file_handler import FileHandler
 logger = setup_logger("main")
 
 
+# Regex compilada uma vez para validar períodos MM/yyyy (2000-2100);
+# o fullmatch roda em C, sem split nem conversões int por chamada.
+_PERIOD_RE = re.compile(r"^(0?[1-9]|1[0-2])/(20\d\d|2100)$")
+
+
 class FipeScraper:
     """
     Classe principal para extração de dados da tabela FIPE.
@@ -71,7 +77,8 @@ class FipeScraper:
                           Valores válidos: "car", "bike", "truck".
                           Se None, extrai todos os tipos.
             use_multiprocessing: Se True, usa multiprocessing para extração paralela.
-                                Se False, executa sequencialmente (mais lento, mas mais estável).
+                                Se False, executa com asyncio em um único
+                                processo, sobrepondo as esperas de rede.
 
         Raises:
             ValueError: Se o formato dos períodos for inválido.
@@ -88,21 +95,17 @@ class FipeScraper:
             ...     vehicle_types=["car"]
             ... )
         """
-        # Valida formato dos períodos
-        if start_period:
-            self._validate_period_format(start_period)
-        if end_period:
-            self._validate_period_format(end_period)
+        # Valida formato dos períodos (valores vazios são ignorados)
+        self._validate_periods((start_period, end_period))
 
-        # Valida tipos de veículos
+        # Valida tipos de veículos delegando ao mapeamento O(1) da API e já
+        # guarda os códigos convertidos para o orquestrador reutilizar.
         if vehicle_types:
-            valid_types = {"car", "bike", "truck", "carro", "moto", "caminhao", "caminhão"}
-            for vt in vehicle_types:
-                if vt.lower() not in valid_types:
-                    raise ValueError(
-                        f"Tipo de veículo inválido: {vt}. "
-                        f"Valores válidos: car, bike, truck"
-                    )
+            self._vehicle_type_codes = [
+                VehicleType.from_string(vt) for vt in vehicle_types
+            ]
+        else:
+            self._vehicle_type_codes = None
 
         self.start_period = start_period
         self.end_period = end_period
@@ -115,44 +118,22 @@ class FipeScraper:
             f"tipos={vehicle_types or 'todos'}, multiprocessing={use_multiprocessing}"
         )
 
-    def _validate_period_format(self, period: str) -> None:
+    @staticmethod
+    def _validate_periods(periods: Iterable[str]) -> None:
         """
-        Valida o formato de um período (MM/yyyy).
+        Valida vários períodos de uma vez com a mesma regex compilada.
 
         Args:
-            period: Período a validar
+            periods: Sequência de períodos MM/yyyy
 
         Raises:
-            ValueError: Se o formato for inválido
+            ValueError: Se algum período for inválido
         """
-        if not period:
-            return
-
-        parts = period.split("/")
-
-        if len(parts) != 2:
-            raise ValueError(
-                f"Formato de período inválido: {period}. "
-                f"Use o formato MM/yyyy (ex: 01/2024)"
-            )
-
-        month, year = parts
-
-        try:
-            month_int = int(month)
-            year_int = int(year)
-
-            if not (1 <= month_int <= 12):
-                raise ValueError(f"Mês inválido: {month}")
-
-            if year_int < 2000 or year_int > 2100:
-                raise ValueError(f"Ano inválido: {year}")
+        invalid = [p for p in periods if p and not _PERIOD_RE.fullmatch(p)]
 
-        except ValueError as e:
-            if "inválido" in str(e).lower():
-                raise
+        if invalid:
             raise ValueError(
-                f"Formato de período inválido: {period}. "
+                f"Formato de período inválido: {', '.join(invalid)}. "
                 f"Use o formato MM/yyyy (ex: 01/2024)"
             )
 
@@ -191,7 +172,8 @@ class FipeScraper:
             start_period=self.start_period,
             end_period=self.end_period,
             vehicle_types=self.vehicle_types,
-            use_multiprocessing=self.use_multiprocessing
+            use_multiprocessing=self.use_multiprocessing,
+            vehicle_type_codes=self._vehicle_type_codes
         )
 
         result = orchestrator.run()
@@ -231,8 +213,8 @@ class FipeScraper:
         """
         output_path = Config.get_final_output_path()
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(result.to_dict(), f, ensure_ascii=False, indent=2)
+        # Serialização em streaming: ver ExtractionResult.dump_json
+        result.dump_json(output_path)
 
         logger.info(f"Resultado final salvo em: {output_path}")
 
@@ -4,12 +4,24 @@ Modelos de dados para o projeto FIPE Scraper.
 Classes que representam as entidades extraídas da API FIPE.
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import orjson
 
-@dataclass
+
+# Conversão de nome de mês em português para número (construída uma única
+# vez; from_api_response é chamado para cada linha da API).
+_MONTH_NUM = {
+    "janeiro": "01", "fevereiro": "02", "março": "03",
+    "abril": "04", "maio": "05", "junho": "06",
+    "julho": "07", "agosto": "08", "setembro": "09",
+    "outubro": "10", "novembro": "11", "dezembro": "12"
+}
+
+
+@dataclass(slots=True)
 class ReferencePeriod:
     """
     Representa um período de referência da tabela FIPE.
@@ -18,6 +30,18 @@ class ReferencePeriod:
 
     period: str  # Formato: MM/yyyy
     code: int = 0  # Código interno da API FIPE
+    sort_key: Tuple[int, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Chave cronológica (ano, mês) pré-calculada uma única vez: a
+        # string MM/yyyy NÃO ordena cronologicamente ("12/2020" > "01/2021"
+        # na comparação lexical), então filtros e max/sort devem usar esta
+        # tupla, não o campo period.
+        month, sep, year = self.period.partition("/")
+        try:
+            self.sort_key = (int(year), int(month)) if sep else (0, 0)
+        except ValueError:
+            self.sort_key = (0, 0)
 
     def __hash__(self):
         return hash(self.period)
@@ -29,7 +53,7 @@ class ReferencePeriod:
 
     def to_dict(self) -> Dict[str, Any]:
         """Converte para dicionário."""
-        return asdict(self)
+        return {"period": self.period, "code": self.code}
 
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> "ReferencePeriod":
@@ -42,22 +66,20 @@ class ReferencePeriod:
         Returns:
             ReferencePeriod: Instância criada
         """
-        # Converte "janeiro/2024" para "01/2024"
-        month_names = {
-            "janeiro": "01", "fevereiro": "02", "março": "03",
-            "abril": "04", "maio": "05", "junho": "06",
-            "julho": "07", "agosto": "08", "setembro": "09",
-            "outubro": "10", "novembro": "11", "dezembro": "12"
-        }
-
+        # Converte "janeiro/2024" para "01/2024". partition evita alocar a
+        # lista intermediária de split; o dicionário de meses é o módulo
+        # _MONTH_NUM, construído uma única vez.
         mes_str = data.get("Mes", "")
-        parts = mes_str.split("/")
-
-        if len(parts) == 2:
-            month_name = parts[0].lower().strip()
-            year = parts[1].strip()
-            month_num = month_names.get(month_name, "01")
-            period = f"{month_num}/{year}"
+        month_name, sep, year = mes_str.partition("/")
+
+        if sep:
+            # Caminho rápido: a FIPE devolve o mês já em minúsculas, então
+            # o lookup direto acerta sem alocar as strings intermediárias
+            # de strip()/lower(); a normalização fica só para o caso raro.
+            month_num = _MONTH_NUM.get(month_name)
+            if month_num is None:
+                month_num = _MONTH_NUM.get(month_name.strip().lower(), "01")
+            period = f"{month_num}/{year.strip()}"
         else:
             period = mes_str
 
@@ -67,7 +89,7 @@ class ReferencePeriod:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Brand:
     """
     Representa uma marca de veículos.
@@ -78,6 +100,11 @@ class Brand:
     vehicle_type: str  # car, bike, truck
     initial_period: Optional[str] = None  # Primeiro período em que a marca apareceu
 
+    # Serialização memoizada (ver to_dict)
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __hash__(self):
         return hash((self.name, self.vehicle_type))
 
@@ -87,8 +114,25 @@ class Brand:
         return self.name == other.name and self.vehicle_type == other.vehicle_type
 
     def to_dict(self) -> Dict[str, Any]:
-        """Converte para dicionário."""
-        return asdict(self)
+        """
+        Converte para dicionário.
+
+        O dict é construído uma vez e reaproveitado: milhares de modelos
+        compartilham a mesma marca e cada Model.to_dict embute a marca,
+        então sem o memo a mesma serialização seria refeita N vezes.
+        Os campos de Brand não mudam após a extração; o dict retornado
+        não deve ser mutado pelo chamador.
+        """
+        cached = self._dict_cache
+        if cached is None:
+            cached = {
+                "name": self.name,
+                "code": self.code,
+                "vehicle_type": self.vehicle_type,
+                "initial_period": self.initial_period
+            }
+            self._dict_cache = cached
+        return cached
 
     @classmethod
     def from_api_response(
@@ -115,8 +159,38 @@ class Brand:
             initial_period=initial_period
         )
 
+    @classmethod
+    def fast(
+        cls,
+        label: str,
+        value: str,
+        vehicle_type: str,
+        initial_period: Optional[str] = None
+    ) -> "Brand":
+        """
+        Caminho rápido para o loop quente de dedup: recebe os campos já
+        extraídos da resposta (sem os .get defensivos de from_api_response).
+        A API FIPE sempre retorna Label e Value, então a verificação extra
+        só custa tempo quando milhões de linhas passam pelo loop.
+
+        Args:
+            label: Nome da marca (campo "Label")
+            value: Código da marca como string (campo "Value")
+            vehicle_type: Tipo do veículo (car, bike, truck)
+            initial_period: Período inicial da marca (opcional)
+
+        Returns:
+            Brand: Instância criada
+        """
+        return cls(
+            name=label,
+            code=int(value),
+            vehicle_type=vehicle_type,
+            initial_period=initial_period
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class Model:
     """
     Representa um modelo de veículo.
@@ -138,14 +212,21 @@ class Model:
 
     def to_dict(self) -> Dict[str, Any]:
         """Converte para dicionário, incluindo referência à marca."""
-        result = {
+        # EAFP: no caminho quente brand é sempre um Brand; o except cobre
+        # resultados reidratados em que ele já vem como dict, sem pagar
+        # isinstance por linha
+        try:
+            brand = self.brand.to_dict()
+        except AttributeError:
+            brand = self.brand
+
+        return {
             "name": self.name,
             "code": self.code,
             "fipe_code": self.fipe_code,
-            "brand": self.brand.to_dict() if isinstance(self.brand, Brand) else self.brand,
+            "brand": brand,
             "vehicle_type": self.vehicle_type
         }
-        return result
 
     @classmethod
     def from_api_response(
@@ -176,7 +257,7 @@ class Model:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class YearModel:
     """
     Representa um ano-modelo de um veículo.
@@ -186,6 +267,17 @@ class YearModel:
     year_code: str    # Ex: "2024-1"
     authentication: str  # Código de autenticação único
     model: Model
+    year_tuple: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Pré-calcula (ano, código do combustível) uma única vez; a consulta
+        # de valor FIPE reutiliza a tupla em vez de refazer o split por chamada.
+        parts = self.year_code.split("-", 1)
+        try:
+            fuel = int(parts[1]) if len(parts) > 1 else 1
+        except ValueError:
+            fuel = 1
+        self.year_tuple = (parts[0], fuel)
 
     def __hash__(self):
         return hash(self.authentication)
@@ -197,13 +289,18 @@ class YearModel:
 
     def to_dict(self) -> Dict[str, Any]:
         """Converte para dicionário, incluindo referência ao modelo."""
-        result = {
+        # EAFP como em Model.to_dict
+        try:
+            model = self.model.to_dict()
+        except AttributeError:
+            model = self.model
+
+        return {
             "description": self.description,
             "year_code": self.year_code,
             "authentication": self.authentication,
-            "model": self.model.to_dict() if isinstance(self.model, Model) else self.model
+            "model": model
         }
-        return result
 
     @classmethod
     def from_api_response(
@@ -231,7 +328,7 @@ class YearModel:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FipeValue:
     """
     Representa um valor FIPE consultado.
@@ -262,22 +359,28 @@ class FipeValue:
 
     def to_dict(self) -> Dict[str, Any]:
         """Converte para dicionário, incluindo referência ao ano-modelo."""
-        result = {
-            "year_model": self.year_model.to_dict() if isinstance(self.year_model, YearModel) else self.year_model,
+        # EAFP como em Model.to_dict
+        try:
+            year_model = self.year_model.to_dict()
+        except AttributeError:
+            year_model = self.year_model
+
+        return {
+            "year_model": year_model,
             "average_price": self.average_price,
             "query_timestamp": self.query_timestamp,
             "reference_period": self.reference_period,
             "fipe_code": self.fipe_code,
             "fuel": self.fuel
         }
-        return result
 
     @classmethod
     def from_api_response(
         cls,
         data: Dict[str, Any],
         year_model: YearModel,
-        reference_period: str
+        reference_period: str,
+        timestamp: Optional[str] = None
     ) -> "FipeValue":
         """
         Cria instância a partir da resposta da API.
@@ -286,6 +389,9 @@ class FipeValue:
             data: Dados da API completa
             year_model: Ano-modelo do veículo
             reference_period: Período de referência
+            timestamp: Timestamp da consulta já formatado. Lotes de valores
+                       consultados juntos podem capturá-lo uma única vez
+                       em vez de chamar datetime.now() por linha.
 
         Returns:
             FipeValue: Instância criada
@@ -293,14 +399,14 @@ class FipeValue:
         return cls(
             year_model=year_model,
             average_price=data.get("Valor", ""),
-            query_timestamp=datetime.now().isoformat(),
+            query_timestamp=timestamp or datetime.now().isoformat(),
             reference_period=reference_period,
             fipe_code=data.get("CodigoFipe", ""),
             fuel=data.get("Combustivel", "")
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionResult:
     """
     Resultado de uma extração completa.
@@ -313,6 +419,17 @@ class ExtractionResult:
     year_models: List[YearModel] = field(default_factory=list)
     fipe_values: List[FipeValue] = field(default_factory=list)
 
+    # Conjuntos de dedup persistentes entre chamadas de merge().
+    # Chave: nome da seção; valor: (lista observada, set, tamanho sincronizado).
+    _dedup_state: Dict[str, tuple] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # Nomes das cinco seções, na ordem de serialização
+    _SECTIONS = (
+        "reference_periods", "brands", "models", "year_models", "fipe_values"
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         """Converte para dicionário."""
         return {
@@ -323,6 +440,77 @@ class ExtractionResult:
             "fipe_values": [v.to_dict() for v in self.fipe_values]
         }
 
+    def iter_sections(self) -> Iterator[Tuple[str, Iterator[Dict[str, Any]]]]:
+        """
+        Itera as seções do resultado como pares (nome, iterador de registros).
+
+        Permite serializar o resultado em streaming, registro a registro,
+        sem materializar o dicionário aninhado completo em memória —
+        importante para exportações de histórico completo com milhões de
+        valores FIPE.
+
+        Yields:
+            Tuple[str, Iterator[Dict]]: Nome da seção e iterador de dicts
+        """
+        yield "reference_periods", (p.to_dict() for p in self.reference_periods)
+        yield "brands", (b.to_dict() for b in self.brands)
+        yield "models", (m.to_dict() for m in self.models)
+        yield "year_models", (y.to_dict() for y in self.year_models)
+        yield "fipe_values", (v.to_dict() for v in self.fipe_values)
+
+    def dump_json(self, path) -> None:
+        """
+        Serializa o resultado direto para um arquivo JSON, em streaming.
+
+        Escreve seção a seção, registro a registro, com orjson: o pico de
+        memória fica em O(1 registro) em vez de materializar o dicionário
+        aninhado completo (2-3x o tamanho do arquivo final) antes de
+        serializar.
+
+        Args:
+            path: Caminho do arquivo de saída
+        """
+        with open(path, "wb") as f:
+            f.write(b"{")
+            for section_idx, (name, items) in enumerate(self.iter_sections()):
+                if section_idx:
+                    f.write(b",")
+                f.write(b'"' + name.encode("utf-8") + b'":[')
+
+                for item_idx, item in enumerate(items):
+                    if item_idx:
+                        f.write(b",")
+                    f.write(orjson.dumps(item))
+
+                f.write(b"]")
+            f.write(b"}")
+
+    def _seen_set(self, section: str, target: list) -> set:
+        """
+        Retorna o conjunto de dedup persistente de uma seção.
+
+        O conjunto só é reconstruído do zero se a lista foi substituída ou
+        encolhida por código externo; appends diretos são incorporados
+        varrendo apenas a cauda ainda não vista. Assim, k mesclas sucessivas
+        custam O(total de itens) em vez de O(n) de reconstrução por chamada.
+
+        Args:
+            section: Nome da seção (ex: "brands")
+            target: Lista atual da seção
+
+        Returns:
+            set: Conjunto com os itens já presentes na lista
+        """
+        state = self._dedup_state.get(section)
+
+        if state is None or state[0] is not target or state[2] > len(target):
+            return set(target)
+
+        seen = state[1]
+        if state[2] < len(target):
+            seen.update(target[state[2]:])
+        return seen
+
     def merge(self, other: "ExtractionResult") -> None:
         """
         Mescla dados de outro resultado, evitando duplicatas.
@@ -330,34 +518,13 @@ class ExtractionResult:
         Args:
             other: Outro resultado de extração
         """
-        # Usa sets para evitar duplicatas
-        existing_periods = set(self.reference_periods)
-        existing_brands = set(self.brands)
-        existing_models = set(self.models)
-        existing_years = set(self.year_models)
-        existing_values = set(self.fipe_values)
-
-        for period in other.reference_periods:
-            if period not in existing_periods:
-                self.reference_periods.append(period)
-                existing_periods.add(period)
-
-        for brand in other.brands:
-            if brand not in existing_brands:
-                self.brands.append(brand)
-                existing_brands.add(brand)
-
-        for model in other.models:
-            if model not in existing_models:
-                self.models.append(model)
-                existing_models.add(model)
-
-        for year_model in other.year_models:
-            if year_model not in existing_years:
-                self.year_models.append(year_model)
-                existing_years.add(year_model)
-
-        for value in other.fipe_values:
-            if value not in existing_values:
-                self.fipe_values.append(value)
-                existing_values.add(value)
+        for section in self._SECTIONS:
+            target = getattr(self, section)
+            seen = self._seen_set(section, target)
+
+            for obj in getattr(other, section):
+                if obj not in seen:
+                    target.append(obj)
+                    seen.add(obj)
+
+            self._dedup_state[section] = (target, seen, len(target))
@@ -4,6 +4,7 @@ Classe base abstrata para scrapers.
 Define a interface comum que todos os scrapers devem implementar.
 """
 
+import time
 from abc import ABC, abstractmethod
 from typing import Any, List
 
@@ -27,6 +28,9 @@ class BaseScraper(ABC):
         self.client = client
         self.logger = setup_logger(self.__class__.__name__)
 
+        # Última emissão de log de progresso (ver _log_progress)
+        self._last_log = 0.0
+
     @abstractmethod
     def extract(self, *args, **kwargs) -> Any:
         """
@@ -42,11 +46,21 @@ class BaseScraper(ABC):
         """
         Registra o progresso da extração.
 
+        Limitado por tempo: no máximo uma linha por segundo, independente
+        da frequência com que os scrapers chamam. A formatação da mensagem
+        e o I/O de log só acontecem quando a linha vai ser emitida; a
+        última iteração sempre é registrada.
+
         Args:
             current: Item atual
             total: Total de itens
             item_name: Nome do tipo de item sendo processado
         """
+        now = time.monotonic()
+        if current != total and now - self._last_log < 1.0:
+            return
+        self._last_log = now
+
         percentage = (current / total * 100) if total > 0 else 0
         self.logger.info(
             f"Progresso {item_name}: {current}/{total} ({percentage:.1f}%)"
@@ -3,12 +3,16 @@
 Scraper para extração de marcas de veículos da tabela FIPE.
 """
 
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
 from typing import Dict, List, Optional, Set
 
 from scrapers.base_scraper import BaseScraper
 from api.fipe_client import FipeClient
 from api.endpoints import VehicleType
 from models.fipe_models import Brand, ReferencePeriod
+from utils.config import Config
 
 
 class BrandScraper(BaseScraper):
@@ -46,41 +50,53 @@ class BrandScraper(BaseScraper):
 
         # Ordena períodos do mais antigo para o mais recente
         # para identificar corretamente o período inicial de cada marca
-        sorted_periods = sorted(periods, key=lambda p: p.period)
-
-        total_iterations = len(sorted_periods) * len(vehicle_types)
+        # attrgetter roda em C, sem frame Python por comparação; sort_key
+        # é a tupla (ano, mês) — a string MM/yyyy não ordena cronologicamente
+        sorted_periods = sorted(periods, key=attrgetter("sort_key"))
+
+        # Conversão código -> string calculada uma vez por tipo, fora dos
+        # loops por período
+        vtype_str = {
+            code: VehicleType.to_string(code) for code in vehicle_types
+        }
+
+        # Todas as combinações (período, tipo) são requisições independentes;
+        # despacha em paralelo para sobrepor a latência de rede em vez de
+        # pagar um round-trip por vez.
+        jobs = [
+            (period, vehicle_type_code)
+            for period in sorted_periods
+            for vehicle_type_code in vehicle_types
+        ]
+
+        total_iterations = len(jobs)
         current_iteration = 0
-
-        for period in sorted_periods:
-            for vehicle_type_code in vehicle_types:
+        responses = []
+
+        with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+            future_to_job = {
+                executor.submit(
+                    self.client.get_brands,
+                    reference_table_code=period.code,
+                    vehicle_type=vehicle_type_code
+                ): (period, vehicle_type_code)
+                for period, vehicle_type_code in jobs
+            }
+
+            for future in as_completed(future_to_job):
+                period, vehicle_type_code = future_to_job[future]
                 current_iteration += 1
-                vehicle_type_str = VehicleType.to_string(vehicle_type_code)
 
                 try:
-                    raw_brands = self.client.get_brands(
-                        reference_table_code=period.code,
-                        vehicle_type=vehicle_type_code
-                    )
+                    raw_brands = future.result()
                 except Exception as e:
                     self.logger.error(
                         f"Erro ao extrair marcas para período {period.period}, "
-                        f"tipo {vehicle_type_str}: {e}"
+                        f"tipo {vtype_str[vehicle_type_code]}: {e}"
                     )
                     continue
 
-                for item in raw_brands:
-                    brand = Brand.from_api_response(
-                        data=item,
-                        vehicle_type=vehicle_type_str,
-                        initial_period=period.period
-                    )
-
-                    key = (brand.name, brand.vehicle_type)
-
-                    # Só adiciona se for a primeira vez que vemos essa marca
-                    # (como os períodos estão ordenados do mais antigo)
-                    if key not in brands_dict:
-                        brands_dict[key] = brand
+                responses.append((period, vehicle_type_code, raw_brands))
 
                 # Log de progresso a cada 10 iterações
                 if current_iteration % 10 == 0:
@@ -90,6 +106,35 @@ class BrandScraper(BaseScraper):
                         "marcas"
                     )
 
+        # As futures completam fora de ordem; reordena do período mais antigo
+        # para o mais recente antes do dedup, preservando a semântica de
+        # "primeiro período em que a marca apareceu".
+        responses.sort(key=lambda item: item[0].sort_key)
+
+        for period, vehicle_type_code, raw_brands in responses:
+            vehicle_type_str = vtype_str[vehicle_type_code]
+
+            # Chave de dedup como string única "tipo\x00nome": um hash de
+            # string em vez de hash de tupla + alocação da tupla por lookup.
+            # sys.intern faz chaves repetidas entre períodos compartilharem
+            # o mesmo objeto (e o hash já calculado).
+            key_prefix = vehicle_type_str + "\x00"
+
+            for item in raw_brands:
+                # Checa a chave antes de construir qualquer objeto: em
+                # períodos posteriores a grande maioria das marcas já foi
+                # vista, e duplicatas não pagam a construção do Brand
+                # (como os períodos estão ordenados do mais antigo)
+                key = sys.intern(key_prefix + item["Label"])
+
+                if key not in brands_dict:
+                    brands_dict[key] = Brand.fast(
+                        item["Label"],
+                        item["Value"],
+                        vehicle_type_str,
+                        period.period
+                    )
+
         brands = list(brands_dict.values())
         self.logger.info(f"Extraídas {len(brands)} marcas únicas")
 
@@ -126,19 +171,19 @@ class BrandScraper(BaseScraper):
             self.logger.error(f"Erro ao extrair marcas: {e}")
             return []
 
-        brands = []
-        seen = set()
-
+        # Dedup ordenado em um único container: a FIPE já devolve marcas
+        # únicas por período, então na prática isto é um passe direto sem
+        # o par lista+set. setdefault preserva a primeira ocorrência caso
+        # haja duplicata.
+        unique_items: Dict[str, dict] = {}
         for item in raw_brands:
-            brand = Brand.from_api_response(
+            unique_items.setdefault(item.get("Label", ""), item)
+
+        return [
+            Brand.from_api_response(
                 data=item,
                 vehicle_type=vehicle_type_str,
                 initial_period=period.period
             )
-
-            key = (brand.name, brand.vehicle_type)
-            if key not in seen:
-                brands.append(brand)
-                seen.add(key)
-
-        return brands
+            for item in unique_items.values()
+        ]
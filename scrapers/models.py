@@ -3,12 +3,14 @@
 Scraper para extração de modelos de veículos da tabela FIPE.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple
 
 from scrapers.base_scraper import BaseScraper
 from api.fipe_client import FipeClient
 from api.endpoints import VehicleType
 from models.fipe_models import Brand, Model, ReferencePeriod
+from utils.config import Config
 
 
 class ModelScraper(BaseScraper):
@@ -39,19 +41,37 @@ class ModelScraper(BaseScraper):
         models = []
         seen_models: set = set()
 
-        for idx, brand in enumerate(brands, 1):
-            brand_models = self.extract_for_brand(period, brand)
-
-            for model in brand_models:
-                key = (model.fipe_code, model.vehicle_type)
+        # Uma requisição independente por marca: despacha todas em paralelo
+        # e acumula os resultados por marca, preservando a ordem original
+        # da lista de entrada no dedup final.
+        models_by_brand: Dict[int, List[Model]] = {}
+
+        with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+            future_to_idx = {
+                executor.submit(self.extract_for_brand, period, brand): idx
+                for idx, brand in enumerate(brands)
+            }
+
+            completed = 0
+            for future in as_completed(future_to_idx):
+                models_by_brand[future_to_idx[future]] = future.result()
+                completed += 1
+
+                # Log de progresso a cada 5 marcas
+                if completed % 5 == 0:
+                    self._log_progress(completed, len(brands), "modelos por marca")
+
+        for idx, brand in enumerate(brands):
+            # Chave de dedup como string única (ver BrandScraper): hash de
+            # string simples no lugar de tupla alocada por lookup
+            key_prefix = brand.vehicle_type + "\x00"
+
+            for model in models_by_brand.get(idx, []):
+                key = key_prefix + model.fipe_code
                 if key not in seen_models:
                     models.append(model)
                     seen_models.add(key)
 
-            # Log de progresso a cada 5 marcas
-            if idx % 5 == 0:
-                self._log_progress(idx, len(brands), "modelos por marca")
-
         self.logger.info(f"Extraídos {len(models)} modelos únicos")
         return models
 
@@ -88,21 +108,20 @@ class ModelScraper(BaseScraper):
             )
             return []
 
-        models = []
         raw_models = response.get("Modelos", [])
 
-        for item in raw_models:
-            # O código FIPE completo será obtido quando consultarmos o valor
-            # Por enquanto, usamos um placeholder
-            model = Model.from_api_response(
+        # O código FIPE completo será obtido quando consultarmos o valor;
+        # por enquanto fica um placeholder. List comprehension evita o
+        # dispatch de list.append por elemento.
+        return [
+            Model.from_api_response(
                 data=item,
                 brand=brand,
                 vehicle_type=brand.vehicle_type,
                 fipe_code=""  # Será preenchido depois
             )
-            models.append(model)
-
-        return models
+            for item in raw_models
+        ]
 
     def get_models_with_fipe_codes(
         self,
@@ -123,9 +142,14 @@ class ModelScraper(BaseScraper):
             List[Model]: Lista de modelos com código FIPE atualizado
         """
         vehicle_type_code = VehicleType.from_string(brand.vehicle_type)
-        updated_models = []
 
-        for model in models:
+        def _fetch_code(model: Model) -> Model:
+            """
+            Pipeline de um modelo: anos-modelo e, em seguida, o valor FIPE.
+            As duas requisições de um modelo continuam sequenciais (a segunda
+            depende da primeira), mas os pipelines de modelos diferentes
+            rodam sobrepostos no pool.
+            """
             try:
                 # Busca os anos-modelo para obter um ano e consultar o valor
                 years_response = self.client.get_year_models(
@@ -139,8 +163,7 @@ class ModelScraper(BaseScraper):
                     self.logger.warning(
                         f"Nenhum ano-modelo encontrado para {model.name}"
                     )
-                    updated_models.append(model)
-                    continue
+                    return model
 
                 # Usa o primeiro ano disponível para consultar o código FIPE
                 first_year = years_response[0]
@@ -157,19 +180,20 @@ class ModelScraper(BaseScraper):
                 fipe_code = value_response.get("CodigoFipe", "")
 
                 # Cria novo modelo com código FIPE
-                updated_model = Model(
+                return Model(
                     name=model.name,
                     code=model.code,
                     fipe_code=fipe_code,
                     brand=model.brand,
                     vehicle_type=model.vehicle_type
                 )
-                updated_models.append(updated_model)
 
             except Exception as e:
                 self.logger.error(
                     f"Erro ao obter código FIPE para {model.name}: {e}"
                 )
-                updated_models.append(model)
+                return model
 
-        return updated_models
+        # executor.map preserva a ordem da lista de entrada
+        with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+            return list(executor.map(_fetch_code, models))
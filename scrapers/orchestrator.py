@@ -4,14 +4,24 @@ Orquestrador de scraping com suporte a multiprocessing.
 Coordena a extração de dados e gerencia arquivos parciais.
 """
 
+import asyncio
+import itertools
 import json
 import os
-import uuid
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import queue
+import threading
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed
+)
+from functools import partial
+from datetime import datetime
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
 from api.fipe_client import FipeClient
+from api.async_fipe_client import AsyncFipeClient
 from api.endpoints import VehicleType
 from models.fipe_models import (
     Brand,
@@ -44,16 +54,41 @@ class ExtractionTask:
     vehicle_type: int
 
 
-def _extract_worker(task: ExtractionTask) -> Dict[str, Any]:
+# Cliente HTTP e scraper de valores persistentes do processo worker
+# (ver _init_worker)
+_WORKER_CLIENT: Optional[FipeClient] = None
+_WORKER_VALUE_SCRAPER: Optional[ValueScraper] = None
+
+
+def _init_worker() -> None:
+    """
+    Inicializador dos processos do pool: cria um único FipeClient por
+    worker. O cliente (e seu pool de conexões keep-alive) sobrevive a
+    todas as tarefas do processo, em vez de refazer handshake TCP+TLS
+    a cada tarefa. O ValueScraper persiste junto para que seu cache de
+    anos-modelo atravesse as tarefas do worker — um scraper por tarefa
+    nunca veria o mesmo modelo duas vezes.
+    """
+    global _WORKER_CLIENT, _WORKER_VALUE_SCRAPER
+    _WORKER_CLIENT = FipeClient()
+    _WORKER_VALUE_SCRAPER = ValueScraper(_WORKER_CLIENT)
+
+
+def _extract_worker(task: ExtractionTask) -> ExtractionResult:
     """
     Worker function para extração em paralelo.
     Cada worker processa uma marca em um período.
 
+    O resultado volta como ExtractionResult: o pool serializa o grafo de
+    objetos com pickle protocolo 5 uma única vez (a memoização do pickle
+    preserva referências compartilhadas de Brand/Model), em vez de
+    converter para dict no worker e reconstruir tudo no processo pai.
+
     Args:
         task: Tarefa de extração
 
     Returns:
-        Dict[str, Any]: Resultado da extração serializado
+        ExtractionResult: Resultado parcial da tarefa
     """
     # Recria objetos a partir dos dicionários serializados
     period = ReferencePeriod(
@@ -68,10 +103,15 @@ def _extract_worker(task: ExtractionTask) -> Dict[str, Any]:
         initial_period=task.brand.get("initial_period")
     )
 
-    # Cria cliente e scrapers para este worker
-    client = FipeClient()
+    # Reusa o cliente e o scraper de valores persistentes do processo;
+    # só cria (e fecha) instâncias próprias se o worker for chamado fora
+    # do pool.
+    owns_client = _WORKER_CLIENT is None
+    client = FipeClient() if owns_client else _WORKER_CLIENT
     model_scraper = ModelScraper(client)
-    value_scraper = ValueScraper(client)
+    value_scraper = (
+        ValueScraper(client) if owns_client else _WORKER_VALUE_SCRAPER
+    )
 
     result = ExtractionResult()
 
@@ -79,25 +119,32 @@ def _extract_worker(task: ExtractionTask) -> Dict[str, Any]:
         # Extrai modelos da marca
         models = model_scraper.extract_for_brand(period, brand)
 
-        # Para cada modelo, extrai anos-modelo e valores
-        for model in models:
-            year_models = value_scraper.extract_year_models(period, model)
-
-            for year_model in year_models:
-                fipe_value = value_scraper.extract_fipe_value(period, year_model)
+        # As consultas de valor de um modelo são independentes entre si:
+        # dispara todas em paralelo para que os anos de um modelo custem
+        # ~1 RTT em vez de N. O pool vive pela tarefa inteira.
+        with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as pool:
+            for model in models:
+                year_models = value_scraper.extract_year_models(period, model)
+
+                # pool.map preserva a ordem dos anos-modelo
+                fipe_values = pool.map(
+                    partial(value_scraper.extract_fipe_value, period),
+                    year_models
+                )
 
-                if fipe_value:
-                    # Adiciona ao resultado
-                    result.year_models.append(year_model)
-                    result.fipe_values.append(fipe_value)
+                for year_model, fipe_value in zip(year_models, fipe_values):
+                    if fipe_value:
+                        # Adiciona ao resultado
+                        result.year_models.append(year_model)
+                        result.fipe_values.append(fipe_value)
 
-                    # Atualiza código FIPE do modelo se necessário
-                    if fipe_value.fipe_code and not model.fipe_code:
-                        model.fipe_code = fipe_value.fipe_code
+                        # Atualiza código FIPE do modelo se necessário
+                        if fipe_value.fipe_code and not model.fipe_code:
+                            model.fipe_code = fipe_value.fipe_code
 
-            # Adiciona modelo ao resultado
-            if model.fipe_code:
-                result.models.append(model)
+                # Adiciona modelo ao resultado
+                if model.fipe_code:
+                    result.models.append(model)
 
         # Adiciona marca ao resultado
         result.brands.append(brand)
@@ -105,9 +152,10 @@ def _extract_worker(task: ExtractionTask) -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"Erro no worker {task.task_id}: {e}")
     finally:
-        client.close()
+        if owns_client:
+            client.close()
 
-    return result.to_dict()
+    return result
 
 
 class Orchestrator:
@@ -121,7 +169,8 @@ class Orchestrator:
         start_period: Optional[str] = None,
         end_period: Optional[str] = None,
         vehicle_types: Optional[List[str]] = None,
-        use_multiprocessing: bool = True
+        use_multiprocessing: bool = True,
+        vehicle_type_codes: Optional[List[int]] = None
     ):
         """
         Inicializa o orquestrador.
@@ -130,14 +179,19 @@ class Orchestrator:
             start_period: Período inicial no formato MM/yyyy (opcional)
             end_period: Período final no formato MM/yyyy (opcional)
             vehicle_types: Lista de tipos de veículos (car, bike, truck) (opcional)
-            use_multiprocessing: Se True, usa multiprocessing; se False, executa sequencialmente
+            use_multiprocessing: Se True, usa multiprocessing; se False,
+                                executa com asyncio em um único processo
+            vehicle_type_codes: Códigos já convertidos pelo chamador; quando
+                               presentes, evitam nova normalização das strings
         """
         self.start_period = start_period
         self.end_period = end_period
         self.use_multiprocessing = use_multiprocessing
 
-        # Converte tipos de veículos para códigos
-        if vehicle_types:
+        # Converte tipos de veículos para códigos (se já não vieram prontos)
+        if vehicle_type_codes is not None:
+            self.vehicle_type_codes = vehicle_type_codes
+        elif vehicle_types:
             self.vehicle_type_codes = [
                 VehicleType.from_string(vt) for vt in vehicle_types
             ]
@@ -146,6 +200,17 @@ class Orchestrator:
 
         self.max_workers = Config.MAX_WORKERS
 
+        # Escrita de checkpoints em thread de fundo (ver _enqueue_partial_write)
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+
+        # Pool de processos de longa duração (ver _get_executor)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        # IDs de tarefa: contador monotônico — único dentro da execução,
+        # ordenável nos logs e sem o custo de uuid4 por tarefa
+        self._tid = itertools.count()
+
         logger.info(
             f"Orquestrador inicializado: período={start_period}-{end_period}, "
             f"tipos={vehicle_types or 'todos'}, workers={self.max_workers}, "
@@ -159,6 +224,11 @@ class Orchestrator:
         Returns:
             ExtractionResult: Resultado consolidado da extração
         """
+        # Para carga limitada por I/O, o caminho asyncio sobrepõe as esperas
+        # de rede em um único processo, sem custo de fork/pickle.
+        if not self.use_multiprocessing:
+            return asyncio.run(self.run_async())
+
         logger.info("Iniciando extração de dados da FIPE...")
 
         # 1. Extrai períodos de referência
@@ -182,9 +252,16 @@ class Orchestrator:
         # 2. Para cada período, extrai marcas e cria tarefas
         tasks = []
 
+        # Plano de tarefas dedupado na origem: cada (marca, período, tipo)
+        # vira no máximo uma tarefa, em vez de depender do merge posterior
+        # para absorver trabalho repetido
+        seen_tasks = set()
+
         # Usamos apenas o período mais recente para obter as marcas
         # (para identificar o período inicial, processamos todos depois)
-        latest_period = max(periods, key=lambda p: p.period)
+        # sort_key compara (ano, mês); a string MM/yyyy NÃO ordena
+        # cronologicamente ("12/2020" > "01/2021" na comparação lexical)
+        latest_period = max(periods, key=lambda p: p.sort_key)
 
         with FipeClient() as client:
             brand_scraper = BrandScraper(client)
@@ -203,8 +280,13 @@ class Orchestrator:
                 # Cria tarefas para cada combinação marca + período
                 for brand in brands:
                     for period in periods:
+                        task_key = (brand.code, period.code, vehicle_type_code)
+                        if task_key in seen_tasks:
+                            continue
+                        seen_tasks.add(task_key)
+
                         task = ExtractionTask(
-                            task_id=str(uuid.uuid4())[:8],
+                            task_id=f"t{next(self._tid):07d}",
                             period=period.to_dict(),
                             brand=brand.to_dict(),
                             vehicle_type=vehicle_type_code
@@ -213,36 +295,66 @@ class Orchestrator:
 
         logger.info(f"Criadas {len(tasks)} tarefas de extração")
 
-        # 3. Executa extração em paralelo ou sequencialmente
+        # 3. Executa extração em paralelo com multiprocessing
         final_result = ExtractionResult()
         final_result.reference_periods = periods
 
-        if self.use_multiprocessing:
-            # Processa em lotes para evitar sobrecarga de memória
-            batch_size = self.max_workers * 2
+        # Cada execução começa com o arquivo de checkpoints zerado: os
+        # registros são append-only dentro da execução, mas sobras de uma
+        # execução anterior (mesmo bem-sucedida) seriam mescladas junto por
+        # uma consolidação posterior.
+        FileHandler.reset_partial_file("batches.jsonl")
+
+        # Registro-cabeçalho com os períodos de referência: os deltas dos
+        # workers nunca os carregam (só o resultado final do pai), então sem
+        # este registro uma retomada via consolidate_partials reconstruiria
+        # tudo menos reference_periods.
+        header = ExtractionResult()
+        header.reference_periods = periods
+        self._enqueue_partial_write(header, "batches.jsonl")
+
+        # Submete o plano inteiro de uma vez e consome por as_completed:
+        # fatiar em lotes fazia os workers ociosos esperarem a tarefa mais
+        # lenta de cada lote antes de receber trabalho novo. O checkpoint
+        # mantém a cadência antiga (um delta a cada max_workers*2 tarefas).
+        checkpoint_every = self.max_workers * 2
+        delta = ExtractionResult()
+        completed = 0
+
+        try:
+            executor = self._get_executor()
+            future_to_task = {
+                executor.submit(_extract_worker, task): task
+                for task in tasks
+            }
+
+            for future in as_completed(future_to_task):
+                task = future_to_task[future]
+                completed += 1
 
-            for batch_idx in range(0, len(tasks), batch_size):
-                batch = tasks[batch_idx:batch_idx + batch_size]
-                batch_results = self._process_batch(batch, batch_idx, len(tasks))
+                try:
+                    delta.merge(future.result())
+                except Exception as e:
+                    logger.error(f"Erro na tarefa {task.task_id}: {e}")
 
-                # Mescla resultados do lote
-                for result_dict in batch_results:
-                    batch_result = self._dict_to_result(result_dict)
-                    final_result.merge(batch_result)
+                if completed % checkpoint_every and completed != len(tasks):
+                    continue
 
-                # Salva arquivo parcial do lote
-                partial_filename = f"batch_{batch_idx // batch_size}.json"
-                FileHandler.save_partial(
-                    {"batch": batch_idx, "data": final_result.to_dict()},
-                    partial_filename
-                )
-        else:
-            # Modo sequencial: processa uma tarefa por vez
-            for idx, task in enumerate(tasks):
-                logger.info(f"Processando tarefa {idx + 1}/{len(tasks)}")
-                result_dict = _extract_worker(task)
-                result = self._dict_to_result(result_dict)
-                final_result.merge(result)
+                logger.info(f"Concluídas {completed}/{len(tasks)} tarefas")
+
+                # Anexa apenas o delta acumulado no arquivo parcial
+                # append-only; reescrever o acumulado a cada checkpoint
+                # custaria O(N²) bytes. A serialização + I/O rodam na
+                # thread de fundo, fora do caminho crítico.
+                if any(getattr(delta, s) for s in ExtractionResult._SECTIONS):
+                    final_result.merge(delta)
+                    self._enqueue_partial_write(delta, "batches.jsonl")
+                    delta = ExtractionResult()
+        finally:
+            self.close()
+
+        # Garante que todos os checkpoints chegaram ao disco
+        self._write_queue.join()
 
         logger.info(
             f"Extração concluída: {len(final_result.brands)} marcas, "
@@ -253,183 +365,409 @@ class Orchestrator:
 
         return final_result
 
-    def _process_batch(
-        self,
-        tasks: List[ExtractionTask],
-        batch_start: int,
-        total_tasks: int
-    ) -> List[Dict[str, Any]]:
+    async def run_async(self) -> ExtractionResult:
         """
-        Processa um lote de tarefas em paralelo.
+        Executa a extração completa com asyncio + AsyncFipeClient.
 
-        Args:
-            tasks: Lista de tarefas do lote
-            batch_start: Índice inicial do lote
-            total_tasks: Total de tarefas
+        Todo o fan-out por (marca, período) roda como corrotinas no mesmo
+        processo: as esperas de rede se sobrepõem via asyncio.gather,
+        limitadas pelo semáforo do cliente, sem custo de fork nem de
+        serialização de resultados entre processos.
 
         Returns:
-            List[Dict[str, Any]]: Resultados do lote
+            ExtractionResult: Resultado consolidado da extração
         """
-        results = []
+        logger.info("Iniciando extração assíncrona de dados da FIPE...")
 
-        logger.info(
-            f"Processando lote {batch_start // len(tasks) + 1}: "
-            f"tarefas {batch_start + 1}-{batch_start + len(tasks)} de {total_tasks}"
-        )
+        final_result = ExtractionResult()
 
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submete todas as tarefas
-            future_to_task = {
-                executor.submit(_extract_worker, task): task
-                for task in tasks
-            }
+        async with AsyncFipeClient() as client:
+            # 1. Extrai períodos de referência
+            try:
+                raw_periods = await client.get_reference_tables()
+            except Exception as e:
+                logger.error(f"Erro ao extrair períodos de referência: {e}")
+                return final_result
 
-            # Coleta resultados conforme completam
-            for future in as_completed(future_to_task):
-                task = future_to_task[future]
+            periods = []
+            seen_periods = set()
 
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
+            for item in raw_periods:
+                period = ReferencePeriod.from_api_response(item)
+                if period.period not in seen_periods:
+                    periods.append(period)
+                    seen_periods.add(period.period)
+
+            # Filtra por intervalo se especificado
+            reference_scraper = ReferenceScraper(client)
+            periods = reference_scraper.filter_by_range(
+                periods,
+                self.start_period,
+                self.end_period
+            )
+
+            if not periods:
+                logger.warning("Nenhum período encontrado para extração")
+                return final_result
+
+            final_result.reference_periods = periods
+            logger.info(
+                f"Serão processados {len(periods)} períodos de referência"
+            )
+
+            # 2. Marcas do período mais recente, por tipo de veículo.
+            # sort_key compara (ano, mês); a string MM/yyyy NÃO ordena
+            # cronologicamente ("12/2020" > "01/2021" na comparação lexical)
+            latest_period = max(periods, key=lambda p: p.sort_key)
+
+            brand_lists = await asyncio.gather(
+                *[
+                    client.get_brands(latest_period.code, vt_code)
+                    for vt_code in self.vehicle_type_codes
+                ],
+                return_exceptions=True
+            )
+
+            pairs = []  # (marca, período, código do tipo de veículo)
+
+            for vt_code, raw_brands in zip(self.vehicle_type_codes, brand_lists):
+                vehicle_type_str = VehicleType.to_string(vt_code)
+
+                if isinstance(raw_brands, BaseException):
                     logger.error(
-                        f"Erro na tarefa {task.task_id}: {e}"
+                        f"Erro ao extrair marcas para tipo "
+                        f"{vehicle_type_str}: {raw_brands}"
                     )
+                    continue
 
-        return results
+                seen_brands = set()
 
-    def _dict_to_result(self, data: Dict[str, Any]) -> ExtractionResult:
+                for item in raw_brands:
+                    brand = Brand.from_api_response(
+                        data=item,
+                        vehicle_type=vehicle_type_str,
+                        initial_period=latest_period.period
+                    )
+
+                    key = (brand.name, brand.vehicle_type)
+                    if key in seen_brands:
+                        continue
+                    seen_brands.add(key)
+
+                    for period in periods:
+                        pairs.append((brand, period, vt_code))
+
+            logger.info(f"Criadas {len(pairs)} tarefas de extração")
+
+            # 3. Fan-out concorrente por (marca, período)
+            tasks = [
+                self._extract_brand_period(client, brand, period, vt_code)
+                for brand, period, vt_code in pairs
+            ]
+
+            completed = 0
+            for future in asyncio.as_completed(tasks):
+                result = await future
+                final_result.merge(result)
+
+                completed += 1
+                if completed % 20 == 0:
+                    logger.info(
+                        f"Progresso: {completed}/{len(tasks)} tarefas concluídas"
+                    )
+
+        logger.info(
+            f"Extração concluída: {len(final_result.brands)} marcas, "
+            f"{len(final_result.models)} modelos, "
+            f"{len(final_result.year_models)} anos-modelo, "
+            f"{len(final_result.fipe_values)} valores FIPE"
+        )
+
+        return final_result
+
+    async def _extract_brand_period(
+        self,
+        client: AsyncFipeClient,
+        brand: Brand,
+        period: ReferencePeriod,
+        vehicle_type_code: int
+    ) -> ExtractionResult:
         """
-        Converte dicionário para ExtractionResult.
+        Extrai modelos, anos-modelo e valores FIPE de uma marca em um
+        período, usando o despacho em lote do cliente assíncrono.
 
         Args:
-            data: Dicionário com dados
+            client: Cliente FIPE assíncrono compartilhado
+            brand: Marca a processar
+            period: Período de referência
+            vehicle_type_code: Código do tipo de veículo
 
         Returns:
-            ExtractionResult: Objeto de resultado
+            ExtractionResult: Resultado parcial da marca/período
         """
         result = ExtractionResult()
 
-        # Converte períodos
-        for p_dict in data.get("reference_periods", []):
-            period = ReferencePeriod(
-                period=p_dict.get("period", ""),
-                code=p_dict.get("code", 0)
+        # Timestamp capturado uma vez por marca/período: os valores do lote
+        # são temporalmente próximos e dispensam um datetime.now() por linha
+        batch_timestamp = datetime.now().isoformat()
+
+        try:
+            response = await client.get_models(
+                reference_table_code=period.code,
+                vehicle_type=vehicle_type_code,
+                brand_code=brand.code
             )
-            result.reference_periods.append(period)
+        except Exception as e:
+            logger.error(f"Erro ao extrair modelos da marca {brand.name}: {e}")
+            return result
 
-        # Converte marcas
-        brand_cache = {}
-        for b_dict in data.get("brands", []):
-            brand = Brand(
-                name=b_dict.get("name", ""),
-                code=b_dict.get("code", 0),
-                vehicle_type=b_dict.get("vehicle_type", ""),
-                initial_period=b_dict.get("initial_period")
+        models = [
+            Model.from_api_response(
+                data=item,
+                brand=brand,
+                vehicle_type=brand.vehicle_type,
+                fipe_code=""
             )
-            result.brands.append(brand)
-            brand_cache[(brand.name, brand.vehicle_type)] = brand
+            for item in response.get("Modelos", [])
+        ]
+
+        # Anos-modelo de todos os modelos, coalescidos em lotes
+        year_lists = await asyncio.gather(
+            *[
+                client.enqueue_year_models(
+                    period.code, vehicle_type_code, brand.code, model.code
+                )
+                for model in models
+            ],
+            return_exceptions=True
+        )
 
-        # Converte modelos
-        model_cache = {}
-        for m_dict in data.get("models", []):
-            # Recupera marca
-            brand_dict = m_dict.get("brand", {})
-            brand_key = (brand_dict.get("name", ""), brand_dict.get("vehicle_type", ""))
-            brand = brand_cache.get(brand_key)
+        for model, raw_years in zip(models, year_lists):
+            if isinstance(raw_years, BaseException):
+                logger.error(
+                    f"Erro ao extrair anos-modelo de {model.name}: {raw_years}"
+                )
+                continue
 
-            if not brand:
-                brand = Brand(
-                    name=brand_dict.get("name", ""),
-                    code=brand_dict.get("code", 0),
-                    vehicle_type=brand_dict.get("vehicle_type", ""),
-                    initial_period=brand_dict.get("initial_period")
+            year_models = [
+                YearModel.from_api_response(
+                    data=item,
+                    model=model,
+                    authentication=""
                 )
+                for item in raw_years
+            ]
 
-            model = Model(
-                name=m_dict.get("name", ""),
-                code=m_dict.get("code", 0),
-                fipe_code=m_dict.get("fipe_code", ""),
-                brand=brand,
-                vehicle_type=m_dict.get("vehicle_type", "")
+            value_responses = await asyncio.gather(
+                *[
+                    client.enqueue_fipe_value(
+                        period.code, vehicle_type_code, brand.code,
+                        model.code, year_model.year_code,
+                        year_tuple=year_model.year_tuple
+                    )
+                    for year_model in year_models
+                ],
+                return_exceptions=True
             )
-            result.models.append(model)
-            model_cache[(model.fipe_code, model.vehicle_type)] = model
 
-        # Converte anos-modelo
-        year_model_cache = {}
-        for y_dict in data.get("year_models", []):
-            # Recupera modelo
-            model_dict = y_dict.get("model", {})
-            model_key = (model_dict.get("fipe_code", ""), model_dict.get("vehicle_type", ""))
-            model = model_cache.get(model_key)
-
-            if not model:
-                # Cria modelo se não existe no cache
-                brand_dict = model_dict.get("brand", {})
-                brand = Brand(
-                    name=brand_dict.get("name", ""),
-                    code=brand_dict.get("code", 0),
-                    vehicle_type=brand_dict.get("vehicle_type", ""),
-                    initial_period=brand_dict.get("initial_period")
-                )
-                model = Model(
-                    name=model_dict.get("name", ""),
-                    code=model_dict.get("code", 0),
-                    fipe_code=model_dict.get("fipe_code", ""),
-                    brand=brand,
-                    vehicle_type=model_dict.get("vehicle_type", "")
+            for year_model, value_response in zip(year_models, value_responses):
+                if isinstance(value_response, BaseException):
+                    logger.error(
+                        f"Erro ao extrair valor FIPE de {model.name} "
+                        f"{year_model.description}: {value_response}"
+                    )
+                    continue
+
+                # Atualiza o ano-modelo com a autenticação
+                year_model.authentication = value_response.get("Autenticacao", "")
+
+                # Atualiza código FIPE do modelo se necessário
+                fipe_code = value_response.get("CodigoFipe", "")
+                if fipe_code and not model.fipe_code:
+                    model.fipe_code = fipe_code
+
+                fipe_value = FipeValue.from_api_response(
+                    data=value_response,
+                    year_model=year_model,
+                    reference_period=period.period,
+                    timestamp=batch_timestamp
                 )
 
-            year_model = YearModel(
-                description=y_dict.get("description", ""),
-                year_code=y_dict.get("year_code", ""),
-                authentication=y_dict.get("authentication", ""),
-                model=model
+                result.year_models.append(year_model)
+                result.fipe_values.append(fipe_value)
+
+            if model.fipe_code:
+                result.models.append(model)
+
+        result.brands.append(brand)
+        return result
+
+    def _enqueue_partial_write(
+        self,
+        delta: ExtractionResult,
+        filename: str
+    ) -> None:
+        """
+        Agenda a escrita de um delta de checkpoint na thread de fundo.
+
+        O loop de lotes não bloqueia em serialização nem em I/O de disco:
+        enfileira o delta e segue para o próximo lote. Os deltas não são
+        mutados após a mescla, então serializar depois é seguro. A thread
+        é daemon e criada sob demanda; run()/finalize() drenam a fila
+        antes de concluir.
+
+        Args:
+            delta: Resultado parcial do lote (não mutado após o enfileiro)
+            filename: Nome do arquivo parcial append-only
+        """
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(
+                target=self._drain_writes,
+                name="partial-writer",
+                daemon=True
             )
-            result.year_models.append(year_model)
-            year_model_cache[year_model.authentication] = year_model
+            self._writer_thread.start()
 
-        # Converte valores FIPE
-        for v_dict in data.get("fipe_values", []):
-            # Recupera ano-modelo
-            year_dict = v_dict.get("year_model", {})
-            auth = year_dict.get("authentication", "")
-            year_model = year_model_cache.get(auth)
+        self._write_queue.put((delta, filename))
+
+    def _drain_writes(self) -> None:
+        """
+        Loop da thread de escrita: consome deltas da fila e os anexa no
+        arquivo parcial. Erros são registrados sem derrubar a extração.
+        """
+        while True:
+            delta, filename = self._write_queue.get()
+            try:
+                FileHandler.append_partial_record(delta.to_dict(), filename)
+            except Exception as e:
+                logger.error(f"Erro ao gravar checkpoint em {filename}: {e}")
+            finally:
+                self._write_queue.task_done()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Retorna o pool de processos, criando-o na primeira chamada.
+
+        O pool é um só para a execução inteira: criar um executor novo
+        por lote refazia fork + import + _init_worker (centenas de ms por
+        worker) a cada poucos segundos. max_tasks_per_child=50 recicla
+        cada worker após 50 tarefas, zerando buffers acumulados e heap
+        fragmentada sem pagar o custo de recriar o pool todo.
+
+        Returns:
+            ProcessPoolExecutor: Pool compartilhado da execução
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                max_tasks_per_child=50
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """
+        Encerra o pool de processos, se criado.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        """Permite uso com context manager."""
+        return self
 
-            if not year_model:
-                # Cria ano-modelo se não existe no cache
-                model_dict = year_dict.get("model", {})
-                brand_dict = model_dict.get("brand", {})
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Encerra o pool ao sair do context manager."""
+        self.close()
+
+    def _dict_to_result(self, data: Dict[str, Any]) -> ExtractionResult:
+        """
+        Converte dicionário para ExtractionResult.
+
+        Args:
+            data: Dicionário com dados
+
+        Returns:
+            ExtractionResult: Objeto de resultado
+        """
+        result = ExtractionResult()
+
+        # Caches de reidratação: cada entidade única é construída uma vez
+        # e reusada em todas as linhas que a referenciam. Os misses também
+        # alimentam o cache — a versão anterior alocava objetos-sombra de
+        # marca/modelo novos a cada linha não encontrada.
+        brand_cache: Dict[tuple, Brand] = {}
+        model_cache: Dict[tuple, Model] = {}
+        year_model_cache: Dict[str, YearModel] = {}
+
+        def _get_brand(b_dict: Dict[str, Any]) -> Brand:
+            key = (b_dict.get("name", ""), b_dict.get("vehicle_type", ""))
+            brand = brand_cache.get(key)
+            if brand is None:
                 brand = Brand(
-                    name=brand_dict.get("name", ""),
-                    code=brand_dict.get("code", 0),
-                    vehicle_type=brand_dict.get("vehicle_type", ""),
-                    initial_period=brand_dict.get("initial_period")
+                    name=b_dict.get("name", ""),
+                    code=b_dict.get("code", 0),
+                    vehicle_type=b_dict.get("vehicle_type", ""),
+                    initial_period=b_dict.get("initial_period")
                 )
+                brand_cache[key] = brand
+            return brand
+
+        def _get_model(m_dict: Dict[str, Any]) -> Model:
+            key = (m_dict.get("fipe_code", ""), m_dict.get("vehicle_type", ""))
+            model = model_cache.get(key)
+            if model is None:
                 model = Model(
-                    name=model_dict.get("name", ""),
-                    code=model_dict.get("code", 0),
-                    fipe_code=model_dict.get("fipe_code", ""),
-                    brand=brand,
-                    vehicle_type=model_dict.get("vehicle_type", "")
+                    name=m_dict.get("name", ""),
+                    code=m_dict.get("code", 0),
+                    fipe_code=m_dict.get("fipe_code", ""),
+                    brand=_get_brand(m_dict.get("brand", {})),
+                    vehicle_type=m_dict.get("vehicle_type", "")
                 )
+                model_cache[key] = model
+            return model
+
+        def _get_year_model(y_dict: Dict[str, Any]) -> YearModel:
+            auth = y_dict.get("authentication", "")
+            year_model = year_model_cache.get(auth)
+            if year_model is None:
                 year_model = YearModel(
-                    description=year_dict.get("description", ""),
-                    year_code=year_dict.get("year_code", ""),
+                    description=y_dict.get("description", ""),
+                    year_code=y_dict.get("year_code", ""),
                     authentication=auth,
-                    model=model
+                    model=_get_model(y_dict.get("model", {}))
                 )
+                year_model_cache[auth] = year_model
+            return year_model
 
-            fipe_value = FipeValue(
-                year_model=year_model,
+        # Converte períodos
+        for p_dict in data.get("reference_periods", []):
+            result.reference_periods.append(ReferencePeriod(
+                period=p_dict.get("period", ""),
+                code=p_dict.get("code", 0)
+            ))
+
+        # Converte marcas, modelos e anos-modelo via os caches
+        for b_dict in data.get("brands", []):
+            result.brands.append(_get_brand(b_dict))
+
+        for m_dict in data.get("models", []):
+            result.models.append(_get_model(m_dict))
+
+        for y_dict in data.get("year_models", []):
+            result.year_models.append(_get_year_model(y_dict))
+
+        # Converte valores FIPE
+        for v_dict in data.get("fipe_values", []):
+            result.fipe_values.append(FipeValue(
+                year_model=_get_year_model(v_dict.get("year_model", {})),
                 average_price=v_dict.get("average_price", ""),
                 query_timestamp=v_dict.get("query_timestamp", ""),
                 reference_period=v_dict.get("reference_period", ""),
                 fipe_code=v_dict.get("fipe_code", ""),
                 fuel=v_dict.get("fuel", "")
-            )
-            result.fipe_values.append(fipe_value)
+            ))
 
         return result
 
@@ -438,5 +776,10 @@ class Orchestrator:
         Consolida todos os arquivos parciais no arquivo final.
         """
         logger.info("Finalizando e consolidando arquivos parciais...")
+
+        # Aguarda a thread de escrita esvaziar a fila de checkpoints
+        if self._writer_thread is not None:
+            self._write_queue.join()
+
         FileHandler.consolidate_partials()
         logger.info("Consolidação concluída")
@@ -71,16 +71,16 @@ class ReferenceScraper(BaseScraper):
                 return (int(parts[1]), int(parts[0]))
             return (0, 0)
 
-        filtered = []
-
+        # Só os limites precisam de parse; os períodos usam a chave
+        # (ano, mês) pré-calculada em ReferencePeriod.sort_key, sem
+        # refazer split+int por item a cada chamada.
         start_tuple = parse_period(start_period) if start_period else (0, 0)
         end_tuple = parse_period(end_period) if end_period else (9999, 12)
 
-        for period in periods:
-            period_tuple = parse_period(period.period)
-
-            if start_tuple <= period_tuple <= end_tuple:
-                filtered.append(period)
+        filtered = [
+            period for period in periods
+            if start_tuple <= period.sort_key <= end_tuple
+        ]
 
         self.logger.info(
             f"Filtrados {len(filtered)} períodos de {len(periods)} "
@@ -4,6 +4,7 @@ Scraper para extração de valores FIPE dos veículos.
 Inclui extração de anos-modelo e valores completos.
 """
 
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
 from scrapers.base_scraper import BaseScraper
@@ -23,6 +24,20 @@ class ValueScraper(BaseScraper):
     Scraper responsável por extrair anos-modelo e valores FIPE.
     """
 
+    def __init__(self, client: FipeClient):
+        super().__init__(client)
+
+        # Cache de anos-modelo por (tipo de veículo, model.code): a lista
+        # de anos de um modelo raramente muda de um mês para o outro, então
+        # períodos consecutivos do mesmo ano reaproveitam a resposta e
+        # economizam uma requisição por (modelo × período). Só rende quando
+        # o scraper sobrevive a várias tarefas — ver o scraper persistente
+        # por worker em _init_worker. O tipo de veículo entra na chave
+        # porque códigos de modelo de carro e moto podem coincidir.
+        # Invalidado na virada de ano do período.
+        self._year_cache: Dict[Tuple[str, int], List[YearModel]] = {}
+        self._year_cache_year: Optional[int] = None
+
     def extract_year_models(
         self,
         period: ReferencePeriod,
@@ -38,13 +53,32 @@ class ValueScraper(BaseScraper):
         Returns:
             List[YearModel]: Lista de anos-modelo
         """
-        brand = model.brand if isinstance(model.brand, Brand) else None
-
-        if not brand:
-            self.logger.error(
-                f"Modelo {model.name} não possui marca válida"
-            )
-            return []
+        # model.brand é Brand por construção em todos os fluxos de extração
+        # (ver Model.from_api_response e Orchestrator._dict_to_result), então
+        # o caminho quente dispensa o isinstance por chamada
+        brand = model.brand
+
+        # Invalida o cache na virada de ano do período: é quando novos
+        # anos-modelo costumam entrar na tabela
+        period_year = period.sort_key[0]
+        if period_year != self._year_cache_year:
+            self._year_cache.clear()
+            self._year_cache_year = period_year
+
+        cache_key = (model.vehicle_type, model.code)
+        cached = self._year_cache.get(cache_key)
+        if cached is not None:
+            # Cópias novas por período: a autenticação é preenchida pela
+            # consulta de valor e não pode vazar entre períodos
+            return [
+                YearModel(
+                    description=year_model.description,
+                    year_code=year_model.year_code,
+                    authentication="",
+                    model=model
+                )
+                for year_model in cached
+            ]
 
         vehicle_type_code = VehicleType.from_string(model.vehicle_type)
 
@@ -75,12 +109,15 @@ class ValueScraper(BaseScraper):
             )
             year_models.append(year_model)
 
+        self._year_cache[cache_key] = year_models
+
         return year_models
 
     def extract_fipe_value(
         self,
         period: ReferencePeriod,
-        year_model: YearModel
+        year_model: YearModel,
+        timestamp: Optional[str] = None
     ) -> Optional[FipeValue]:
         """
         Extrai o valor FIPE para um ano-modelo específico.
@@ -88,25 +125,16 @@ class ValueScraper(BaseScraper):
         Args:
             period: Período de referência
             year_model: Ano-modelo do veículo
+            timestamp: Timestamp de consulta compartilhado pelo lote
+                       (opcional; ver FipeValue.from_api_response)
 
         Returns:
             Optional[FipeValue]: Valor FIPE ou None em caso de erro
         """
-        model = year_model.model if isinstance(year_model.model, Model) else None
-
-        if not model:
-            self.logger.error(
-                f"Ano-modelo {year_model.description} não possui modelo válido"
-            )
-            return None
-
-        brand = model.brand if isinstance(model.brand, Brand) else None
-
-        if not brand:
-            self.logger.error(
-                f"Modelo {model.name} não possui marca válida"
-            )
-            return None
+        # Mesma invariante de extract_year_models: as referências aninhadas
+        # são objetos reais por construção, sem isinstance por chamada
+        model = year_model.model
+        brand = model.brand
 
         vehicle_type_code = VehicleType.from_string(model.vehicle_type)
 
@@ -121,7 +149,8 @@ class ValueScraper(BaseScraper):
                 vehicle_type=vehicle_type_code,
                 brand_code=brand.code,
                 model_code=model.code,
-                year_model=year_model.year_code
+                year_model=year_model.year_code,
+                year_tuple=year_model.year_tuple
             )
         except Exception as e:
             self.logger.error(
@@ -142,7 +171,8 @@ class ValueScraper(BaseScraper):
         fipe_value = FipeValue.from_api_response(
             data=response,
             year_model=year_model,
-            reference_period=period.period
+            reference_period=period.period,
+            timestamp=timestamp
         )
 
         return fipe_value
@@ -173,29 +203,32 @@ class ValueScraper(BaseScraper):
         seen_year_models: set = set()
         seen_fipe_values: set = set()
 
+        # Timestamp único para o lote: as consultas são temporalmente
+        # próximas e dispensam um datetime.now() por valor
+        batch_timestamp = datetime.now().isoformat()
+
         for idx, model in enumerate(models, 1):
             # Extrai anos-modelo
             year_models = self.extract_year_models(period, model)
 
             for year_model in year_models:
                 # Extrai valor FIPE para cada ano-modelo
-                fipe_value = self.extract_fipe_value(period, year_model)
+                fipe_value = self.extract_fipe_value(
+                    period, year_model, timestamp=batch_timestamp
+                )
 
                 if fipe_value:
-                    # Evita duplicatas de anos-modelo
+                    # Evita duplicatas de anos-modelo. A autenticação do
+                    # year_model é a mesma embutida no fipe_value, então a
+                    # chave de valor dispensa o isinstance por iteração.
                     year_key = year_model.authentication
                     if year_key and year_key not in seen_year_models:
                         all_year_models.append(year_model)
                         seen_year_models.add(year_key)
 
                     # Evita duplicatas de valores FIPE
-                    value_key = (
-                        fipe_value.year_model.authentication
-                        if isinstance(fipe_value.year_model, YearModel)
-                        else "",
-                        fipe_value.reference_period
-                    )
-                    if value_key[0] and value_key not in seen_fipe_values:
+                    value_key = (year_key, fipe_value.reference_period)
+                    if year_key and value_key not in seen_fipe_values:
                         all_fipe_values.append(fipe_value)
                         seen_fipe_values.add(value_key)
 
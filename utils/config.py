@@ -4,71 +4,93 @@ Módulo de configuração do projeto.
 Carrega variáveis de ambiente do arquivo .env e disponibiliza para o projeto.
 """
 
+import functools
 import os
+import types
 from pathlib import Path
+from typing import NamedTuple
 from dotenv import load_dotenv
 
 
-# Carrega o arquivo .env da raiz do projeto
+# Carrega o arquivo .env da raiz do projeto. A sentinela no ambiente evita
+# reparsear o arquivo em processos filhos (spawn herda o ambiente do pai,
+# já populado com os valores do .env carregados abaixo).
 _project_root = Path(__file__).parent.parent
 _env_path = _project_root / ".env"
-load_dotenv(_env_path)
 
+if not os.environ.get("_FIPE_ENV_LOADED"):
+    load_dotenv(_env_path)
+    os.environ["_FIPE_ENV_LOADED"] = "1"
 
-class Config:
+
+class _Config(NamedTuple):
     """
-    Classe de configuração centralizada.
-    Carrega todas as variáveis de ambiente necessárias para o projeto.
+    Configuração centralizada do projeto.
+
+    Instanciada uma única vez (ver Config abaixo) com os valores do
+    ambiente. Como NamedTuple o singleton é imutável e cada leitura de
+    Config.X é um índice de tupla em C, em vez da descida por
+    type.__getattribute__ de atributos de classe.
     """
 
     # URL base da API FIPE
-    FIPE_BASE_URL: str = os.getenv("FIPE_BASE_URL", "https://veiculos.fipe.org.br/api/veiculos/")
+    FIPE_BASE_URL: str
 
     # Headers para requisições HTTP
-    USER_AGENT: str = os.getenv(
-        "USER_AGENT",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
-    REFERER: str = os.getenv("REFERER", "https://veiculos.fipe.org.br/")
+    USER_AGENT: str
+    REFERER: str
 
     # Configurações de retry com exponential backoff
-    MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "5"))
-    INITIAL_BACKOFF: float = float(os.getenv("INITIAL_BACKOFF", "1.0"))
-    MAX_BACKOFF: float = float(os.getenv("MAX_BACKOFF", "60.0"))
-    BACKOFF_MULTIPLIER: float = float(os.getenv("BACKOFF_MULTIPLIER", "2.0"))
-    REQUEST_TIMEOUT: int = int(os.getenv("REQUEST_TIMEOUT", "30"))
-    DELAY_BETWEEN_REQUESTS: float = float(os.getenv("DELAY_BETWEEN_REQUESTS", "0.5"))
+    MAX_RETRIES: int
+    INITIAL_BACKOFF: float
+    MAX_BACKOFF: float
+    BACKOFF_MULTIPLIER: float
+    REQUEST_TIMEOUT: int
+    DELAY_BETWEEN_REQUESTS: float
 
     # Configurações de processamento paralelo
-    MAX_WORKERS: int = int(os.getenv("MAX_WORKERS", "4"))
+    MAX_WORKERS: int
+
+    # Máximo de requisições assíncronas simultâneas
+    MAX_CONCURRENT: int
+
+    # Cache de respostas em disco: reexecuções e retomadas reaproveitam
+    # respostas de períodos já fechados sem nova ida à rede
+    USE_RESPONSE_CACHE: bool
 
     # Diretórios e arquivos de saída
-    OUTPUT_DIR: str = os.getenv("OUTPUT_DIR", "output")
-    PARTIAL_OUTPUT_DIR: str = os.getenv("PARTIAL_OUTPUT_DIR", "output/partial")
-    FINAL_OUTPUT_FILE: str = os.getenv("FINAL_OUTPUT_FILE", "output/fipe_complete.json")
+    OUTPUT_DIR: str
+    PARTIAL_OUTPUT_DIR: str
+    FINAL_OUTPUT_FILE: str
 
     # Logging
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
-    LOG_FILE: str = os.getenv("LOG_FILE", "output/fipe_scraper.log")
+    LOG_LEVEL: str
+    LOG_FILE: str
 
-    @classmethod
-    def get_headers(cls) -> dict:
+    @functools.cache
+    def get_headers(self) -> types.MappingProxyType:
         """
         Retorna os headers padrão para requisições HTTP.
 
+        O dicionário é construído uma única vez (os valores vêm do .env e
+        não mudam durante a execução) e devolvido como mapeamento imutável,
+        já que clientes são recriados por worker/lote no caminho MP.
+
         Returns:
-            dict: Dicionário com os headers necessários
+            MappingProxyType: Mapeamento imutável com os headers necessários
         """
-        return {
-            "User-Agent": cls.USER_AGENT,
-            "Referer": cls.REFERER,
+        return types.MappingProxyType({
+            "User-Agent": self.USER_AGENT,
+            "Referer": self.REFERER,
             "Content-Type": "application/json",
             "Accept": "application/json",
+            # Respostas JSON da FIPE são altamente repetitivas e comprimem
+            # bem; os clientes descomprimem de forma transparente.
+            "Accept-Encoding": "br, gzip, deflate",
             "Origin": "https://veiculos.fipe.org.br"
-        }
+        })
 
-    @classmethod
-    def get_output_path(cls, filename: str) -> Path:
+    def get_output_path(self, filename: str) -> Path:
         """
         Retorna o caminho completo para um arquivo de saída.
 
@@ -78,10 +100,9 @@ class Config:
         Returns:
             Path: Caminho completo do arquivo
         """
-        return _project_root / cls.OUTPUT_DIR / filename
+        return _OUTPUT_ROOT / filename
 
-    @classmethod
-    def get_partial_output_path(cls, filename: str) -> Path:
+    def get_partial_output_path(self, filename: str) -> Path:
         """
         Retorna o caminho completo para um arquivo parcial de saída.
 
@@ -91,24 +112,68 @@ class Config:
         Returns:
             Path: Caminho completo do arquivo parcial
         """
-        return _project_root / cls.PARTIAL_OUTPUT_DIR / filename
+        return _PARTIAL_ROOT / filename
+
+    def get_partial_output_dir(self) -> Path:
+        """
+        Retorna o diretório dos arquivos parciais de saída.
+
+        Returns:
+            Path: Caminho do diretório de parciais
+        """
+        return _PARTIAL_ROOT
 
-    @classmethod
-    def get_final_output_path(cls) -> Path:
+    def get_final_output_path(self) -> Path:
         """
         Retorna o caminho completo para o arquivo final consolidado.
 
         Returns:
             Path: Caminho completo do arquivo final
         """
-        return _project_root / cls.FINAL_OUTPUT_FILE
+        return _FINAL_PATH
 
-    @classmethod
-    def get_log_path(cls) -> Path:
+    def get_log_path(self) -> Path:
         """
         Retorna o caminho completo para o arquivo de log.
 
         Returns:
             Path: Caminho completo do arquivo de log
         """
-        return _project_root / cls.LOG_FILE
+        return _LOG_PATH
+
+
+# Singleton imutável: os consumidores seguem usando Config.X e
+# Config.get_*() exatamente como antes.
+Config = _Config(
+    FIPE_BASE_URL=os.getenv("FIPE_BASE_URL", "https://veiculos.fipe.org.br/api/veiculos/"),
+    USER_AGENT=os.getenv(
+        "USER_AGENT",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    REFERER=os.getenv("REFERER", "https://veiculos.fipe.org.br/"),
+    MAX_RETRIES=int(os.getenv("MAX_RETRIES", "5")),
+    INITIAL_BACKOFF=float(os.getenv("INITIAL_BACKOFF", "1.0")),
+    MAX_BACKOFF=float(os.getenv("MAX_BACKOFF", "60.0")),
+    BACKOFF_MULTIPLIER=float(os.getenv("BACKOFF_MULTIPLIER", "2.0")),
+    REQUEST_TIMEOUT=int(os.getenv("REQUEST_TIMEOUT", "30")),
+    DELAY_BETWEEN_REQUESTS=float(os.getenv("DELAY_BETWEEN_REQUESTS", "0.5")),
+    MAX_WORKERS=int(os.getenv("MAX_WORKERS", "4")),
+    MAX_CONCURRENT=int(os.getenv("MAX_CONCURRENT", "32")),
+    USE_RESPONSE_CACHE=os.getenv(
+        "USE_RESPONSE_CACHE", "true"
+    ).lower() in ("1", "true", "yes"),
+    OUTPUT_DIR=os.getenv("OUTPUT_DIR", "output"),
+    PARTIAL_OUTPUT_DIR=os.getenv("PARTIAL_OUTPUT_DIR", "output/partial"),
+    FINAL_OUTPUT_FILE=os.getenv("FINAL_OUTPUT_FILE", "output/fipe_complete.json"),
+    LOG_LEVEL=os.getenv("LOG_LEVEL", "INFO"),
+    LOG_FILE=os.getenv("LOG_FILE", "output/fipe_scraper.log")
+)
+
+
+# Prefixos de saída pré-computados: os valores vêm do .env e não mudam em
+# runtime, então o join _project_root / diretório é pago uma única vez no
+# import em vez de a cada chamada dos getters acima.
+_OUTPUT_ROOT = _project_root / Config.OUTPUT_DIR
+_PARTIAL_ROOT = _project_root / Config.PARTIAL_OUTPUT_DIR
+_FINAL_PATH = _project_root / Config.FINAL_OUTPUT_FILE
+_LOG_PATH = _project_root / Config.LOG_FILE
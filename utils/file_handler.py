@@ -4,11 +4,17 @@ Módulo utilitário para manipulação de arquivos JSON.
 Responsável por salvar dados parciais e consolidar arquivos.
 """
 
-import json
+import mmap
 import os
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List
 
+import orjson
+
 from utils.config import Config
 from utils.logger import setup_logger
 
@@ -16,6 +22,12 @@ from utils.logger import setup_logger
 logger = setup_logger("file_handler")
 
 
+# Diretório de parciais resolvido uma vez no import: evita reconstruir o
+# caminho a cada listagem e usa a mesma raiz absoluta dos gravadores
+# (save_partial/append_partial_record), independente do cwd.
+_PARTIAL_DIR = str(Config.get_partial_output_dir())
+
+
 class FileHandler:
     """
     Classe responsável pela manipulação de arquivos JSON.
@@ -47,12 +59,60 @@ class FileHandler:
         output_path = Config.get_partial_output_path(filename)
         FileHandler.ensure_directory(output_path.parent)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # Formato interno: orjson codifica em C direto para bytes, sem
+        # indentação — os parciais são consumidos apenas pela consolidação
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(data))
 
-        logger.info(f"Arquivo parcial salvo: {output_path}")
+        logger.info("Arquivo parcial salvo: %s", output_path)
         return output_path
 
+    @staticmethod
+    def append_partial_record(record: Dict[str, Any], filename: str) -> Path:
+        """
+        Anexa um registro como uma linha JSONL em um arquivo parcial.
+
+        Diferente de save_partial, o arquivo nunca é reescrito: cada
+        checkpoint acrescenta apenas os bytes do próprio registro, o que
+        elimina a amplificação de escrita O(N²) e torna o pipeline
+        tolerante a interrupções.
+
+        Args:
+            record: Registro a anexar (estrutura serializável em JSON)
+            filename: Nome do arquivo (sem caminho, extensão .jsonl)
+
+        Returns:
+            Path: Caminho do arquivo parcial
+        """
+        output_path = Config.get_partial_output_path(filename)
+        FileHandler.ensure_directory(output_path.parent)
+
+        with open(output_path, "ab") as f:
+            f.write(orjson.dumps(record) + b"\n")
+
+        logger.debug("Registro anexado em: %s", output_path)
+        return output_path
+
+    @staticmethod
+    def reset_partial_file(filename: str) -> None:
+        """
+        Remove um arquivo parcial de uma execução anterior, se existir.
+
+        Os gravadores append-only (append_partial_record) nunca truncam o
+        arquivo, então cada execução precisa começar do zero: sem isto,
+        uma consolidação posterior mesclaria checkpoints de execuções
+        distintas em um único resultado.
+
+        Args:
+            filename: Nome do arquivo (sem caminho)
+        """
+        output_path = Config.get_partial_output_path(filename)
+        try:
+            output_path.unlink()
+            logger.debug("Arquivo parcial anterior removido: %s", output_path)
+        except FileNotFoundError:
+            pass
+
     @staticmethod
     def load_partial(filename: str) -> Dict[str, Any]:
         """
@@ -67,133 +127,316 @@ class FileHandler:
         input_path = Config.get_partial_output_path(filename)
 
         if not input_path.exists():
-            logger.warning(f"Arquivo parcial não encontrado: {input_path}")
+            logger.warning("Arquivo parcial não encontrado: %s", input_path)
             return {}
 
-        with open(input_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        # orjson decodifica em C direto dos bytes, como na consolidação
+        return orjson.loads(input_path.read_bytes())
 
     @staticmethod
-    def list_partial_files() -> List[Path]:
+    def list_partial_files() -> List[str]:
         """
         Lista todos os arquivos parciais no diretório de saída.
 
+        os.scandir devolve os nomes direto do syscall, sem construir um
+        objeto Path por entrada como Path.glob faz; os caminhos circulam
+        como str e só viram Path onde o chamador realmente precisa.
+
         Returns:
-            List[Path]: Lista de caminhos dos arquivos parciais
+            List[str]: Lista de caminhos dos arquivos parciais
         """
-        partial_dir = Path(Config.PARTIAL_OUTPUT_DIR)
-
-        if not partial_dir.exists():
+        try:
+            with os.scandir(_PARTIAL_DIR) as entries:
+                return sorted(
+                    entry.path
+                    for entry in entries
+                    if entry.name.endswith((".json", ".jsonl"))
+                    and entry.is_file()
+                )
+        except FileNotFoundError:
             return []
 
-        return list(partial_dir.glob("*.json"))
+    # Acima deste tamanho, arquivos .json são mapeados com mmap em vez de
+    # copiados para um bytes; abaixo dele o setup do mapeamento não compensa
+    _MMAP_THRESHOLD = 1 << 20
+
+    @staticmethod
+    def _read_buffer(path: str):
+        """
+        Lê um arquivo parcial como buffer pronto para decodificação.
+
+        Arquivos .json grandes viram um mmap somente-leitura: o orjson
+        decodifica direto do mapeamento (via memoryview), sem a cópia
+        integral para um bytes. Arquivos pequenos e .jsonl (que precisam
+        de splitlines) são lidos normalmente. O chamador fecha o mmap.
+        """
+        with open(path, "rb") as f:
+            if (
+                not path.endswith(".jsonl")
+                and os.fstat(f.fileno()).st_size > FileHandler._MMAP_THRESHOLD
+            ):
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return f.read()
+
+    @staticmethod
+    def _iter_partial_records(partial_files: List[str]):
+        """
+        Itera os registros (dicionários completos) dos arquivos parciais,
+        um de cada vez, sem materializar todos em memória.
+
+        As leituras de disco rodam em um ThreadPoolExecutor com janela de
+        prefetch limitada: enquanto o chamador faz parse/dedup de um
+        arquivo, os próximos já estão sendo lidos (o GIL é liberado durante
+        o read). O parse e o consumo continuam sequenciais no chamador, e a
+        janela mantém no máximo MAX_WORKERS arquivos em memória.
+
+        Args:
+            partial_files: Arquivos parciais a percorrer
+
+        Yields:
+            Dict[str, Any]: Um registro por vez
+        """
+        remaining = iter(partial_files)
+
+        with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+            pending: deque = deque()
+
+            def _prefetch() -> None:
+                path = next(remaining, None)
+                if path is not None:
+                    pending.append(
+                        (path, executor.submit(FileHandler._read_buffer, path))
+                    )
+
+            for _ in range(Config.MAX_WORKERS):
+                _prefetch()
+
+            while pending:
+                partial_file, future = pending.popleft()
+                _prefetch()
+
+                logger.info("Processando arquivo parcial: %s", partial_file)
+
+                try:
+                    raw = future.result()
+                except OSError as e:
+                    logger.error("Erro ao ler arquivo %s: %s", partial_file, e)
+                    continue
+
+                try:
+                    if partial_file.endswith(".jsonl"):
+                        # Arquivos append-only: um registro por linha
+                        for line in raw.splitlines():
+                            if line.strip():
+                                yield orjson.loads(line)
+                    elif isinstance(raw, mmap.mmap):
+                        view = memoryview(raw)
+                        try:
+                            record = orjson.loads(view)
+                        finally:
+                            view.release()
+                            raw.close()
+                        yield record
+                    else:
+                        yield orjson.loads(raw)
+                except orjson.JSONDecodeError as e:
+                    logger.error("Erro ao ler arquivo %s: %s", partial_file, e)
+                    continue
 
     @staticmethod
     def consolidate_partials() -> Path:
         """
         Consolida todos os arquivos parciais em um único arquivo final.
 
+        A consolidação é feita em streaming: as seções pequenas (períodos,
+        marcas, modelos) ficam em memória para ordenação, mas anos-modelo e
+        valores FIPE — as seções que dominam o volume — são derramados já
+        deduplicados em arquivos temporários JSONL e copiados por linha para
+        o arquivo final. O pico de memória fica em O(um parcial) em vez de
+        O(resultado completo).
+
         Returns:
             Path: Caminho do arquivo consolidado
         """
+        output_path = Config.get_final_output_path()
         partial_files = FileHandler.list_partial_files()
 
         if not partial_files:
             logger.warning("Nenhum arquivo parcial encontrado para consolidação")
-            return Config.get_final_output_path()
-
-        # Estrutura consolidada
-        consolidated = {
-            "reference_periods": [],
-            "brands": [],
-            "models": [],
-            "year_models": [],
-            "fipe_values": []
-        }
-
-        # Conjuntos para evitar duplicatas
-        seen_periods = set()
-        seen_brands = set()
-        seen_models = set()
-        seen_year_models = set()
-        seen_fipe_values = set()
+            return output_path
 
-        for partial_file in partial_files:
-            logger.info(f"Processando arquivo parcial: {partial_file}")
-
-            try:
-                with open(partial_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except json.JSONDecodeError as e:
-                logger.error(f"Erro ao ler arquivo {partial_file}: {e}")
-                continue
-
-            # Consolida períodos de referência
-            for period in data.get("reference_periods", []):
-                period_key = period.get("period")
-                if period_key and period_key not in seen_periods:
-                    seen_periods.add(period_key)
-                    consolidated["reference_periods"].append(period)
-
-            # Consolida marcas
-            for brand in data.get("brands", []):
-                brand_key = (brand.get("name"), brand.get("vehicle_type"))
-                if brand_key[0] and brand_key not in seen_brands:
-                    seen_brands.add(brand_key)
-                    consolidated["brands"].append(brand)
-
-            # Consolida modelos
-            for model in data.get("models", []):
-                model_key = (model.get("fipe_code"), model.get("vehicle_type"))
-                if model_key[0] and model_key not in seen_models:
-                    seen_models.add(model_key)
-                    consolidated["models"].append(model)
-
-            # Consolida anos-modelo
-            for year_model in data.get("year_models", []):
-                year_key = (
-                    year_model.get("authentication"),
-                    year_model.get("model", {}).get("fipe_code") if isinstance(year_model.get("model"), dict) else year_model.get("model")
-                )
-                if year_key[0] and year_key not in seen_year_models:
-                    seen_year_models.add(year_key)
-                    consolidated["year_models"].append(year_model)
-
-            # Consolida valores FIPE
-            for fipe_value in data.get("fipe_values", []):
-                value_key = (
-                    fipe_value.get("year_model", {}).get("authentication") if isinstance(fipe_value.get("year_model"), dict) else fipe_value.get("year_model"),
-                    fipe_value.get("reference_period")
-                )
-                if value_key[0] and value_key not in seen_fipe_values:
-                    seen_fipe_values.add(value_key)
-                    consolidated["fipe_values"].append(fipe_value)
-
-        # Ordena os dados
-        consolidated["reference_periods"].sort(
-            key=lambda x: x.get("period", ""),
-            reverse=True
-        )
-        consolidated["brands"].sort(
-            key=lambda x: (x.get("vehicle_type", ""), x.get("name", ""))
-        )
-        consolidated["models"].sort(
-            key=lambda x: (x.get("vehicle_type", ""), x.get("brand", {}).get("name", "") if isinstance(x.get("brand"), dict) else "", x.get("name", ""))
-        )
-
-        # Salva arquivo final
-        output_path = Config.get_final_output_path()
         FileHandler.ensure_directory(output_path.parent)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(consolidated, f, ensure_ascii=False, indent=2)
+        # Seções pequenas: acumuladas em memória (centenas/milhares de
+        # registros) porque o arquivo final as serializa ordenadas. O dict
+        # faz papel duplo de conjunto de dedup e container ordenado por
+        # inserção — uma tabela hash em vez do par lista+set.
+        periods_map: Dict[str, dict] = {}
+        brands_map: Dict[str, dict] = {}
+        models_map: Dict[str, dict] = {}
 
-        logger.info(f"Arquivo consolidado salvo: {output_path}")
-        logger.info(f"Total de períodos: {len(consolidated['reference_periods'])}")
-        logger.info(f"Total de marcas: {len(consolidated['brands'])}")
-        logger.info(f"Total de modelos: {len(consolidated['models'])}")
-        logger.info(f"Total de anos-modelo: {len(consolidated['year_models'])}")
-        logger.info(f"Total de valores FIPE: {len(consolidated['fipe_values'])}")
+        # Conjuntos para evitar duplicatas nas seções derramadas em disco
+        # (os registros em si não ficam em memória)
+        seen_year_models = set()
+        seen_fipe_values = set()
+
+        year_model_count = 0
+        fipe_value_count = 0
+
+        # Seções grandes: derramadas em arquivos temporários ao lado do
+        # arquivo final (extensão .spill para não colidir com o glob de
+        # parciais), uma linha JSON por registro já deduplicado
+        year_models_spill = output_path.with_suffix(".year_models.spill")
+        fipe_values_spill = output_path.with_suffix(".fipe_values.spill")
+
+        try:
+            with open(year_models_spill, "wb") as ym_out, \
+                    open(fipe_values_spill, "wb") as fv_out:
+                for data in FileHandler._iter_partial_records(partial_files):
+                    # Consolida períodos de referência
+                    for period in data.get("reference_periods", []):
+                        period_key = period.get("period")
+                        if period_key and period_key not in periods_map:
+                            periods_map[period_key] = period
+
+                    # Chaves de dedup como string única "a\x1fb" em vez de
+                    # tupla: uma alocação por registro a menos, e o hash de
+                    # str fica cacheado no próprio objeto (o de tupla é
+                    # recalculado a cada sondagem do conjunto)
+
+                    # Consolida marcas. Nomes de marca e tipos de veículo
+                    # têm poucas dezenas de valores únicos repetidos por
+                    # milhares de registros; sys.intern faz os registros
+                    # retidos compartilharem o mesmo objeto str (e
+                    # comparações de chave curto-circuitam por ponteiro)
+                    for brand in data.get("brands", []):
+                        name = brand.get("name")
+                        if not name:
+                            continue
+                        name = sys.intern(name)
+                        vehicle_type = sys.intern(
+                            brand.get("vehicle_type") or ""
+                        )
+                        brand_key = f"{name}\x1f{vehicle_type}"
+                        if brand_key not in brands_map:
+                            brand["name"] = name
+                            brand["vehicle_type"] = vehicle_type
+                            brands_map[brand_key] = brand
+
+                    # Consolida modelos
+                    for model in data.get("models", []):
+                        fipe_code = model.get("fipe_code")
+                        if not fipe_code:
+                            continue
+                        vehicle_type = sys.intern(
+                            model.get("vehicle_type") or ""
+                        )
+                        model_key = f"{fipe_code}\x1f{vehicle_type}"
+                        if model_key not in models_map:
+                            # Normaliza os componentes da ordenação uma vez
+                            # por registro, não uma vez por comparação.
+                            # Nomes de modelo NÃO são internados: são de
+                            # alta cardinalidade e poluiriam a tabela
+                            brand_ref = model.get("brand")
+                            model["_brand_name"] = sys.intern(
+                                brand_ref.get("name", "")
+                                if isinstance(brand_ref, dict)
+                                else ""
+                            )
+                            model["vehicle_type"] = vehicle_type
+                            model.setdefault("name", "")
+                            models_map[model_key] = model
+
+                    # Consolida anos-modelo
+                    for year_model in data.get("year_models", []):
+                        auth = year_model.get("authentication")
+                        if not auth:
+                            continue
+                        model_ref = year_model.get("model")
+                        if isinstance(model_ref, dict):
+                            model_ref = model_ref.get("fipe_code")
+                        year_key = f"{auth}\x1f{model_ref}"
+                        if year_key not in seen_year_models:
+                            seen_year_models.add(year_key)
+                            ym_out.write(orjson.dumps(year_model) + b"\n")
+                            year_model_count += 1
+
+                    # Consolida valores FIPE
+                    for fipe_value in data.get("fipe_values", []):
+                        year_ref = fipe_value.get("year_model")
+                        if isinstance(year_ref, dict):
+                            year_ref = year_ref.get("authentication")
+                        if not year_ref:
+                            continue
+                        value_key = (
+                            f"{year_ref}\x1f{fipe_value.get('reference_period')}"
+                        )
+                        if value_key not in seen_fipe_values:
+                            seen_fipe_values.add(value_key)
+                            fv_out.write(orjson.dumps(fipe_value) + b"\n")
+                            fipe_value_count += 1
+
+            # Ordena as seções pequenas direto dos valores dos dicts.
+            # itemgetter roda em C, sem frame Python por elemento; as
+            # chaves foram garantidas na inserção (setdefault/_brand_name),
+            # então não há .get nem isinstance por comparação
+            periods = sorted(
+                periods_map.values(), key=itemgetter("period"), reverse=True
+            )
+            brands = sorted(
+                brands_map.values(), key=itemgetter("vehicle_type", "name")
+            )
+            models = sorted(
+                models_map.values(),
+                key=itemgetter("vehicle_type", "_brand_name", "name")
+            )
+
+            # A chave auxiliar não pertence ao arquivo final
+            for model in models:
+                del model["_brand_name"]
+
+            # Escreve o arquivo final em streaming, como em
+            # ExtractionResult.dump_json: seção a seção, registro a registro
+            with open(output_path, "wb") as f:
+                f.write(b"{")
+
+                for idx, (name, items) in enumerate((
+                    ("reference_periods", periods),
+                    ("brands", brands),
+                    ("models", models)
+                )):
+                    if idx:
+                        f.write(b",")
+                    f.write(b'"' + name.encode("utf-8") + b'":[')
+                    for item_idx, item in enumerate(items):
+                        if item_idx:
+                            f.write(b",")
+                        f.write(orjson.dumps(item))
+                    f.write(b"]")
+
+                for name, spill_path in (
+                    ("year_models", year_models_spill),
+                    ("fipe_values", fipe_values_spill)
+                ):
+                    f.write(b',"' + name.encode("utf-8") + b'":[')
+                    with open(spill_path, "rb") as spill:
+                        for line_idx, line in enumerate(spill):
+                            if line_idx:
+                                f.write(b",")
+                            f.write(line.rstrip(b"\n"))
+                    f.write(b"]")
+
+                f.write(b"}")
+        finally:
+            year_models_spill.unlink(missing_ok=True)
+            fipe_values_spill.unlink(missing_ok=True)
+
+        logger.info("Arquivo consolidado salvo: %s", output_path)
+        logger.info("Total de períodos: %d", len(periods))
+        logger.info("Total de marcas: %d", len(brands))
+        logger.info("Total de modelos: %d", len(models))
+        logger.info("Total de anos-modelo: %d", year_model_count)
+        logger.info("Total de valores FIPE: %d", fipe_value_count)
 
         return output_path
 
@@ -201,14 +444,27 @@ class FileHandler:
     def cleanup_partials() -> None:
         """
         Remove todos os arquivos parciais após consolidação.
+
+        Arquivos já ausentes não são erro (outra execução pode ter limpado
+        antes); as falhas reais são agregadas em um único warning em vez de
+        um log por arquivo.
         """
         partial_files = FileHandler.list_partial_files()
+        failed = []
 
         for partial_file in partial_files:
             try:
                 os.remove(partial_file)
-                logger.debug(f"Arquivo parcial removido: {partial_file}")
+            except FileNotFoundError:
+                pass
             except OSError as e:
-                logger.warning(f"Erro ao remover arquivo {partial_file}: {e}")
+                failed.append((partial_file, e))
+
+        if failed:
+            logger.warning(
+                "Falha ao remover %d arquivos parciais: %s",
+                len(failed),
+                failed[:10]
+            )
 
-        logger.info(f"Removidos {len(partial_files)} arquivos parciais")
+        logger.info("Removidos %d arquivos parciais", len(partial_files) - len(failed))
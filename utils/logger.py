@@ -5,6 +5,8 @@ Configura o sistema de logs padronizados para monitoramento.
 """
 
 import logging
+import logging.handlers
+import multiprocessing
 import sys
 from pathlib import Path
 from typing import Optional
@@ -12,6 +14,18 @@ from typing import Optional
 from utils.config import Config
 
 
+# Formatter único compartilhado por todos os handlers: o formato é fixo e
+# setup_logger é chamado no import de cada módulo do pacote, então não há
+# motivo para alocar um Formatter (e recompilar o fmt) por chamada.
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+# Nível padrão resolvido uma vez a partir do Config
+_DEFAULT_LEVEL = getattr(logging, Config.LOG_LEVEL.upper(), logging.INFO)
+
+
 def setup_logger(
     name: str = "fipe_scraper",
     log_level: Optional[str] = None,
@@ -30,7 +44,9 @@ def setup_logger(
     """
     # Usa valores padrão do Config se não especificados
     if log_level is None:
-        log_level = Config.LOG_LEVEL
+        level = _DEFAULT_LEVEL
+    else:
+        level = getattr(logging, log_level.upper())
     if log_file is None:
         log_file = Config.get_log_path()
 
@@ -39,28 +55,48 @@ def setup_logger(
 
     # Configura o logger
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, log_level.upper()))
+    logger.setLevel(level)
 
     # Evita adicionar handlers duplicados
     if logger.handlers:
         return logger
 
-    # Formato do log
-    formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
+    # Handler para arquivo: rotação para limitar o tamanho em disco, com
+    # um MemoryHandler na frente agrupando as escritas — INFO/DEBUG vão ao
+    # disco em blocos de 512 registros em vez de um write por linha nos
+    # loops quentes; ERROR e acima descarregam imediatamente. O buffer é
+    # drenado no flush/close (logging.shutdown roda no atexit).
+    #
+    # Todos os processos escrevem no mesmo LOG_FILE, mas só o pai rotaciona:
+    # um rollover em um worker renomearia o arquivo por baixo dos fds
+    # abertos dos outros processos, perdendo/sobrescrevendo segmentos.
+    # maxBytes=0 desliga a rotação e mantém o handler em append puro.
+    if multiprocessing.parent_process() is not None:
+        max_bytes = 0
+    else:
+        max_bytes = 50 * 1024 * 1024
+
+    rotating_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=max_bytes,
+        backupCount=3,
+        encoding="utf-8"
     )
+    rotating_handler.setFormatter(_FORMATTER)
+    rotating_handler.setLevel(level)
 
-    # Handler para arquivo
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
-    file_handler.setFormatter(formatter)
-    file_handler.setLevel(getattr(logging, log_level.upper()))
+    file_handler = logging.handlers.MemoryHandler(
+        capacity=512,
+        flushLevel=logging.ERROR,
+        target=rotating_handler
+    )
+    file_handler.setLevel(level)
     logger.addHandler(file_handler)
 
     # Handler para console
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    console_handler.setLevel(getattr(logging, log_level.upper()))
+    console_handler.setFormatter(_FORMATTER)
+    console_handler.setLevel(level)
     logger.addHandler(console_handler)
 
     return logger